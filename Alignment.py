@@ -18,6 +18,8 @@
 
 import numpy as np
 
+from DPToolkit import RollingTable, memoize
+
 
 def sequence_alignment_numpy(sentence1, sentence2):
     """
@@ -113,6 +115,38 @@ def sequence_alignment_numpy(sentence1, sentence2):
     print(dp)
 
 
+@memoize(maxsize=512)
+def alignment_score(sentence1, sentence2, match_score=2, mismatch_score=-1, gap_penalty=-2):
+    """
+    功能：只计算两个句子的最优全局对齐得分（不回溯对齐路径）。
+    说明：
+        - 第 i 行只依赖第 i-1 行，所以用滚动表只保留两行，内存 O(n) 而不是 O(m*n)
+        - 同一对句子重复调用时直接走缓存
+        - 得分与 sequence_alignment_numpy 打印的 Final Alignment Score 相同
+    """
+    words1 = sentence1.split()
+    words2 = sentence2.split()
+    m, n = len(words1), len(words2)
+
+    # 行的 dtype 跟着得分走：整数得分用整数，浮点得分不会被截断
+    dtype = np.result_type(match_score, mismatch_score, gap_penalty)
+    dp = RollingTable(2)
+    # 第 0 行：句子1为空，只能全是 GAP
+    dp[0] = (np.arange(n + 1) * gap_penalty).astype(dtype)
+
+    for i in range(1, m + 1):
+        prev = dp[i - 1]
+        row = np.empty(n + 1, dtype=dtype)
+        row[0] = i * gap_penalty
+        a = words1[i - 1]
+        for j in range(1, n + 1):
+            diag = prev[j - 1] + (match_score if a == words2[j - 1] else mismatch_score)
+            row[j] = max(diag, prev[j] + gap_penalty, row[j - 1] + gap_penalty)
+        dp[i] = row
+
+    return dp[m][n].item()
+
+
 # === 演示入口 ===
 if __name__ == "__main__":
     # 两段英文句子（你可以自由修改）
@@ -120,4 +154,7 @@ if __name__ == "__main__":
     s2 = "I love to learn computer science everyday"
 
     # 调用主函数，执行序列比对并打印结果
-    sequence_alignment_numpy(s1, s2)
\ No newline at end of file
+    sequence_alignment_numpy(s1, s2)
+
+    # 只要分数时：滚动两行 + 缓存，内存与重复调用都更省
+    print("\nScore only (rolling rows):", alignment_score(s1, s2))
\ No newline at end of file
@@ -1,3 +1,5 @@
+import os
+from bisect import bisect_left
 
 
 def binary_search(arr, target):
@@ -12,6 +14,322 @@ def binary_search(arr, target):
             right = mid - 1
     return -1  # 未找到
 
+
+# =========================
+# Eytzinger（BFS 顺序）布局：一次构建，反复查找
+# =========================
+# 经典二分每次跳到区间中点，数组一旦超过缓存大小，几乎每次探测都是一次 cache miss。
+# Eytzinger 布局把有序数组按“完全二叉搜索树的层序”重新排列：
+#   - 结点 k 的左右孩子是 2k、2k+1（下标从 1 开始）
+#   - 前几层集中在数组开头，天然常驻缓存；每层只往后走，访存模式可预测
+# 查找结果是第一个等于 target 的下标（lower bound）：无重复值时与 binary_search 一致，
+# 有重复值时总是返回最左边的那个，而 binary_search 可能返回其中任意一个。
+
+def build_eytzinger(arr):
+    """
+    把有序数组 arr 转成 Eytzinger 布局。
+    返回 (tree, pos)：
+      - tree[k]：层序第 k 个结点的值（tree[0] 不使用）
+      - pos[k]：该值在原数组 arr 中的下标
+    """
+    n = len(arr)
+    tree = [None] * (n + 1)
+    pos = [0] * (n + 1)
+    i = 0
+    # 用显式栈做中序遍历：中序访问的顺序恰好就是有序数组的顺序
+    stack = []
+    k = 1
+    while stack or k <= n:
+        if k <= n:
+            stack.append(k)
+            k = 2 * k
+        else:
+            k = stack.pop()
+            tree[k] = arr[i]
+            pos[k] = i
+            i += 1
+            k = 2 * k + 1
+    return tree, pos
+
+
+def eytzinger_search(layout, target):
+    """
+    在 build_eytzinger 构建的布局中查找 target，返回其在原数组中的下标，未找到返回 -1。
+    循环体里没有分支判断“找到了没”，只是一路向下走到叶子，再回退到最后一次“向左走”的结点，
+    即第一个 >= target 的元素（lower bound）。
+    """
+    tree, pos = layout
+    n = len(tree) - 1
+    k = 1
+    while k <= n:
+        k = 2 * k + (tree[k] < target)
+    # 去掉末尾连续的 1（那些是“向右走”的步骤），再多去一位，回到 lower bound 结点
+    k >>= (~k & (k + 1)).bit_length()
+    if k and tree[k] == target:
+        return pos[k]
+    return -1
+
+
+def build_eytzinger_array(arr, chunk=1 << 22):
+    """
+    NumPy 版本的 Eytzinger 布局，供批量查找使用；arr 可以是列表或有序 ndarray。
+    返回 (tree, pos) 两个 ndarray，tree 末尾额外放一个哨兵位，便于向量化比较。
+    不经过 Python 列表，直接按公式算出每个中序位置对应的结点编号：
+      把 n 补成满二叉树（N = 2^H - 1 个结点），中序第 i 个（从 1 开始）结点是
+      k = 2^(H-1) / lowbit(i) + i // (2*lowbit(i))，其中 lowbit(i) = i & -i；
+      再去掉 k > n 的结点（都是最后一层的叶子，不改变其余结点的中序顺序）。
+    按块处理，临时数组只和 chunk 有关，10^9 个元素也只多占 tree/pos 本身的内存。
+    """
+    import numpy as np
+
+    data = np.asarray(arr)
+    n = len(data)
+    tree = np.empty(n + 1, dtype=data.dtype)
+    pos = np.empty(n + 1, dtype=np.int64)
+    tree[0] = data[0] if n else 0
+    pos[0] = 0
+    top = 1 << max(n.bit_length() - 1, 0)   # 2^(H-1)
+    full = 2 * top - 1                       # N
+    done = 0
+    for lo in range(1, full + 1, chunk):
+        i = np.arange(lo, min(lo + chunk, full + 1), dtype=np.int64)
+        low = i & -i
+        k = top // low + i // (2 * low)
+        k = k[k <= n]
+        tree[k] = data[done:done + len(k)]
+        pos[k] = np.arange(done, done + len(k))
+        done += len(k)
+    return tree, pos
+
+
+def eytzinger_search_many(layout, targets):
+    """
+    一次查找一批 targets（NumPy 向量化）：所有查询同步地逐层下降，
+    循环次数只等于树高 ⌈log2(n+1)⌉，而不是查询个数。
+    返回与 targets 等长的下标数组，未找到的位置为 -1。
+    """
+    import numpy as np
+
+    tree, pos = layout
+    n = len(tree) - 1
+    targets = np.asarray(targets)
+    k = np.ones(targets.shape, dtype=np.int64)
+    for _ in range(n.bit_length()):
+        # 已经走出树的查询继续“原地”比较哨兵，保持向量化，不影响结果
+        active = k <= n
+        probe = tree[np.where(active, k, 0)]
+        k = np.where(active, 2 * k + (probe < targets), k)
+    # 与标量版一致：去掉末尾连续的 1 再多去一位（lowbit 是 k 最低的 0 位）
+    lowbit = ~k & (k + 1)
+    k = k // (2 * lowbit)
+    found = (k > 0) & (tree[k] == targets)
+    return np.where(found, pos[k], -1)
+
+
+def benchmark_search(sizes=(10**6, 10**7), queries=100000, repeat=3, seed=0,
+                     scalar_limit=10**7):
+    """
+    比较 binary_search、eytzinger_search 以及批量版 eytzinger_search_many 的速度。
+    sizes 的每一项可以是整数 n（生成 0, 2, 4, ... 的有序 NumPy 数组），也可以直接是一个有序 ndarray。
+    随机抽取 queries 个目标（偶数数据时约一半命中、一半不命中），
+    每种方法重复 repeat 次取最快一次，打印每次查找的平均耗时（纳秒）。
+    逐个查找的两种方法要把数据转成 Python 列表（10^9 个元素需要几十 GB），
+    所以 n > scalar_limit 时只测批量版，这两列记为 None。
+    """
+    import time
+
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    results = []
+    for item in sizes:
+        data = np.arange(0, 2 * item, 2) if np.isscalar(item) else np.asarray(item)
+        n = len(data)
+        lo, hi = (data[0], data[-1] + 1) if n else (0, 1)
+        targets_np = rng.integers(lo, hi, queries).astype(data.dtype)
+
+        layout_np = build_eytzinger_array(data)
+        runs = {}
+        if n <= scalar_limit:
+            arr = data.tolist()
+            targets = targets_np.tolist()
+            layout = build_eytzinger(arr)
+
+            def run_binary():
+                for x in targets:
+                    binary_search(arr, x)
+
+            def run_eytzinger():
+                for x in targets:
+                    eytzinger_search(layout, x)
+
+            runs["binary_search"] = run_binary
+            runs["eytzinger_search"] = run_eytzinger
+        runs["eytzinger_search_many"] = lambda: eytzinger_search_many(layout_np, targets_np)
+
+        row = {"n": n, "binary_search": None, "eytzinger_search": None}
+        for name, fn in runs.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            row[name] = best / queries * 1e9
+        results.append(row)
+        def fmt(v):
+            return "       -" if v is None else f"{v:8.1f}"
+
+        print(f"n={n:>12}  binary: {fmt(row['binary_search'])} ns  "
+              f"eytzinger: {fmt(row['eytzinger_search'])} ns  "
+              f"batch: {fmt(row['eytzinger_search_many'])} ns")
+    return results
+
+
+# =========================
+# 直接在磁盘上的有序文件里二分（mmap），不必先读进内存
+# =========================
+# 两种文件格式：
+#   1) 定长记录：每条记录 record_size 字节，前 key_size 字节是键（按字节序比较，数字请用大端编码）
+#   2) 按行排序的文本文件：每行一条记录，按字节序排好，可用 sep 指定“键 = 行首到第一个分隔符”
+# 只把文件映射进地址空间，操作系统按需读页：启动几乎零成本，每次查找只碰 O(log n) 个页。
+# 再配一个可选的稀疏“栅栏索引”（fence index，每隔一段取一个键放内存），
+# 先在内存里定位到很小的一段，再去文件里二分，每次查找只需读几个页。
+
+class _EmptyMap(bytes):
+    """空文件的替身：mmap 不能映射 0 字节的文件，用空 bytes 代替，同样支持 close()。"""
+
+    def close(self):
+        pass
+
+
+def open_sorted_file(path):
+    """
+    以只读方式 mmap 一个有序文件，返回 mmap 对象（用完请 close）。
+    空文件无法 mmap，返回一个空的 bytes 替身，查找结果都是 -1。
+    """
+    import mmap
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _EmptyMap()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _as_bytes(target):
+    return target.encode() if isinstance(target, str) else target
+
+
+def search_records(mm, target, record_size, key_size=None, fences=None):
+    """
+    在定长记录文件中查找键等于 target 的记录，返回记录序号（第几条），未找到返回 -1。
+    有重复键时返回最左边的一条。fences 为 build_record_fences 的结果（可选）。
+    """
+    target = _as_bytes(target)
+    key_size = key_size or record_size
+    count = len(mm) // record_size
+    lo, hi = 0, count
+    if fences is not None:
+        keys, step = fences
+        i = bisect_left(keys, target)
+        # 最左的目标记录一定落在 (第 i-1 个栅栏, 第 i 个栅栏] 之间
+        lo = (i - 1) * step if i > 0 else 0
+        hi = min(i * step + 1, count)
+    # lower bound：第一个键 >= target 的记录
+    while lo < hi:
+        mid = (lo + hi) // 2
+        off = mid * record_size
+        if mm[off:off + key_size] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < count:
+        off = lo * record_size
+        if mm[off:off + key_size] == target:
+            return lo
+    return -1
+
+
+def build_record_fences(mm, record_size, key_size=None, step=1024):
+    """每隔 step 条记录取一个键，返回 (keys, step)，只读 count/step 个位置。"""
+    key_size = key_size or record_size
+    count = len(mm) // record_size
+    keys = []
+    for i in range(0, count, step):
+        off = i * record_size
+        keys.append(mm[off:off + key_size])
+    return keys, step
+
+
+def _line_key(mm, start, sep):
+    """读出从 start 开始的那一行的键（去掉换行符），返回 (key, 下一行起点)。"""
+    end = mm.find(b"\n", start)
+    if end == -1:
+        end = len(mm)
+    line = mm[start:end].rstrip(b"\r")
+    if sep is not None:
+        line = line.split(sep, 1)[0]
+    return line, end + 1
+
+
+def search_lines(mm, target, sep=None, fences=None):
+    """
+    在按行排序的文本文件中查找键等于 target 的行，返回该行起始的字节偏移，未找到返回 -1。
+    每一步把中点回退到所在行的行首，再比较这一行，所以总是落在记录边界上。
+    fences 为 build_line_fences 的结果（可选）。
+    """
+    target = _as_bytes(target)
+    sep = _as_bytes(sep)
+    size = len(mm)
+    lo, hi = 0, size
+    if fences is not None:
+        keys, offsets = fences
+        i = bisect_left(keys, target)
+        lo = offsets[i - 1] if i > 0 else 0
+        hi = offsets[i] if i < len(offsets) else size
+    # 循环不变式：lo 是某一行的行首；第一个键 >= target 的行从 [lo, hi] 中某个行首开始
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = mm.rfind(b"\n", lo, mid) + 1 or lo
+        key, nxt = _line_key(mm, start, sep)
+        if key < target:
+            lo = nxt
+        else:
+            hi = start
+    if lo < size and _line_key(mm, lo, sep)[0] == target:
+        return lo
+    return -1
+
+
+def read_line(mm, offset):
+    """读取从 offset 开始的一整行（不含换行符），配合 search_lines 使用。"""
+    end = mm.find(b"\n", offset)
+    return mm[offset:end if end != -1 else len(mm)].rstrip(b"\r")
+
+
+def build_line_fences(mm, sep=None, step=1 << 20):
+    """
+    每隔约 step 字节取一个栅栏：跳到下一个行首，记下 (键, 偏移)。
+    只读 size/step 个页，不扫描整个文件，所以几十 GB 的文件也能很快建好。
+    返回 (keys, offsets)。
+    """
+    sep = _as_bytes(sep)
+    size = len(mm)
+    keys, offsets = [], []
+    pos = 0
+    while pos < size:
+        if pos:
+            nl = mm.find(b"\n", pos - 1)
+            if nl == -1:
+                break
+            pos = nl + 1
+            if pos >= size:
+                break
+        if not offsets or offsets[-1] != pos:
+            keys.append(_line_key(mm, pos, sep)[0])
+            offsets.append(pos)
+        pos += step
+    return keys, offsets
+
 if __name__ == "__main__":
     data = [1, 3, 5, 7, 9, 11, 13, 15]
     target1 = 7
@@ -21,4 +339,9 @@ if __name__ == "__main__":
     index2 = binary_search(data, target2)
 
     print(f"查找 {target1} 的结果: {index1}")
-    print(f"查找 {target2} 的结果: {index2}")
\ No newline at end of file
+    print(f"查找 {target2} 的结果: {index2}")
+
+    # Eytzinger 布局：构建一次，之后每次查找结果与 binary_search 相同
+    layout = build_eytzinger(data)
+    print(f"Eytzinger 查找 {target1} 的结果: {eytzinger_search(layout, target1)}")
+    print(f"Eytzinger 查找 {target2} 的结果: {eytzinger_search(layout, target2)}")
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Shared helpers for the dynamic programming demos in this project.
+
+- memoize: a memoization decorator with a size-bounded LRU, hit/miss/eviction
+  statistics, and an optional on-disk cache keyed by a hash of the arguments.
+- RollingTable: a tabulation helper that only keeps the last `window` rows/states,
+  for recurrences that only look a fixed distance back (fibonacci looks back 2,
+  row-by-row alignment scoring looks back 1 row).
+
+Used by DynamicProgramming.fibonacci, MatricxChain.matrix_chain_plan and
+Alignment.alignment_score.
+"""
+
+import functools
+import os
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "disk_hits", "maxsize", "currsize"])
+
+
+def _freeze(value):
+    # Turn lists/dicts/sets (e.g. the dimension list p) into hashable keys
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    # NumPy arrays (checked by duck typing, so numpy isn't imported here)
+    if (getattr(value, "__hash__", None) is None
+            and hasattr(value, "dtype") and hasattr(value, "tobytes")):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    return value
+
+
+def memoize(maxsize=128, cache_dir=None):
+    """
+    Memoize a pure function with a bounded LRU cache.
+
+    maxsize:   how many results to keep in memory (None = unbounded). When full,
+               the least recently used entry is evicted and counted in `evictions`.
+    cache_dir: optional directory for a disk-backed second level. Results are
+               pickled to <cache_dir>/<sha256 of function name + args>.pkl, so they
+               survive restarts. Memory misses check the disk before recomputing.
+
+    The wrapped function gets cache_info() and cache_clear(), like functools.lru_cache.
+    List/dict/ndarray arguments are accepted (they are frozen into tuples for the key);
+    any other unhashable argument just bypasses the cache instead of raising.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "disk_hits": 0}
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def disk_path(key):
+            # hashlib/pickle are only needed for the disk cache, so import them lazily
+            import hashlib
+            import pickle
+
+            digest = hashlib.sha256(pickle.dumps((name, key))).hexdigest()
+            return os.path.join(cache_dir, digest + ".pkl")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (_freeze(args), _freeze(kwargs))
+            try:
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            if key in cache:
+                stats["hits"] += 1
+                cache.move_to_end(key)
+                return cache[key]
+
+            stats["misses"] += 1
+            path = disk_path(key) if cache_dir is not None else None
+            if path is not None and os.path.exists(path):
+                import pickle
+
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+                stats["disk_hits"] += 1
+            else:
+                result = func(*args, **kwargs)
+                if path is not None:
+                    import pickle
+
+                    os.makedirs(cache_dir, exist_ok=True)
+                    # Write to a temp file first so a crash never leaves a half-written entry
+                    tmp = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp, "wb") as f:
+                        pickle.dump(result, f)
+                    os.replace(tmp, path)
+
+            cache[key] = result
+            if maxsize is not None and len(cache) > maxsize:
+                cache.popitem(last=False)
+                stats["evictions"] += 1
+            return result
+
+        def cache_info():
+            return CacheInfo(stats["hits"], stats["misses"], stats["evictions"],
+                             stats["disk_hits"], maxsize, len(cache))
+
+        def cache_clear():
+            # Only clears memory; the disk cache is left alone on purpose
+            cache.clear()
+            for k in stats:
+                stats[k] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+class RollingTable:
+    """
+    A DP table that only remembers the last `window` entries.
+
+    Index it like a normal table (table[i] = value, table[i]), filling rows in
+    order; writing entry i silently forgets entry i - window. Reading an entry
+    that has already been forgotten (or never written) raises IndexError, so a
+    recurrence that looks further back than it claimed fails loudly instead of
+    returning garbage.
+
+    Memory is O(window) instead of O(n).
+    """
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._slots = [None] * window
+        self._top = -1  # highest index written so far
+
+    def __setitem__(self, i, value):
+        if i <= self._top - self.window or i > self._top + 1:
+            raise IndexError(f"row {i} is outside the rolling window")
+        self._top = max(self._top, i)
+        self._slots[i % self.window] = value
+
+    def __getitem__(self, i):
+        if i > self._top or i <= self._top - self.window or i < 0:
+            raise IndexError(f"row {i} is not in the rolling window")
+        return self._slots[i % self.window]
+
+    def __len__(self):
+        return self._top + 1
@@ -100,6 +100,61 @@ def reconstruct_path(prev, target):
     path.reverse()
     return path
 
+def dijkstra_csr(graph, source, target=None):
+    """
+    Conversational: Same algorithm, but for big graphs stored as CSR arrays
+    (see LargeGraphs: graph.n, graph.indptr, graph.indices, graph.weights),
+    e.g. a memory-mapped file from LargeGraphs.load_graph. No per-node dicts
+    are built; node ids are 0..n-1.
+
+    If target is given we stop as soon as it is finalized.
+
+    Returns:
+      dist: float64 array of shortest distances (inf = unreachable)
+      prev: int64 array of predecessors (-1 = none)
+    """
+    import numpy as np
+
+    # np.asarray turns np.memmap into a plain view of the same pages: slicing a
+    # memmap builds a new memmap object per node, which is ~2x slower here
+    indptr, indices, weights = (np.asarray(a) for a in (graph.indptr, graph.indices, graph.weights))
+    # Plain lists while searching (scalar list access is much faster than
+    # NumPy scalar access); converted to arrays once at the end
+    dist = [float('inf')] * graph.n
+    prev = [-1] * graph.n
+    done = bytearray(graph.n)
+    dist[source] = 0
+    pq = [(0.0, source)]
+
+    while pq:
+        d, u = heapq.heappop(pq)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+        lo, hi = int(indptr[u]), int(indptr[u + 1])
+        # One slice per node instead of Python tuples per edge
+        for v, w in zip(indices[lo:hi].tolist(), weights[lo:hi].tolist()):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd, v))
+    return np.array(dist), np.array(prev, dtype=np.int64)
+
+def reconstruct_path_csr(prev, target):
+    """
+    Conversational: reconstruct_path for the array version (-1 marks the start).
+    """
+    path = []
+    cur = int(target)
+    while cur != -1:
+        path.append(cur)
+        cur = int(prev[cur])
+    path.reverse()
+    return path
+
 if __name__ == "__main__":
     # Conversational: Build the same undirected weighted "city map" we used in the story.
     # Roads (undirected):
@@ -1,6 +1,7 @@
+from DPToolkit import RollingTable, memoize
 
 
-
+@memoize(maxsize=1024)
 def fibonacci(n):
     # This function calculates the nth Fibonacci number using dynamic programming.
     # It builds up a table of results for all numbers up to n, so we don't repeat work.
@@ -10,19 +11,117 @@ def fibonacci(n):
     if n == 1:
         # If n is 1, return 1 (base case)
         return 1
-    # Create a list to store Fibonacci numbers up to n
-    dp = [0] * (n + 1)
+    # Each step only looks back two entries, so a rolling table of size 2 is enough:
+    # memory stays constant no matter how big n is.
+    dp = RollingTable(2)
     dp[0], dp[1] = 0, 1  # Set the first two Fibonacci numbers
     for i in range(2, n + 1):
         # For each number from 2 to n, calculate its Fibonacci value
         # by adding the two previous Fibonacci numbers
         dp[i] = dp[i - 1] + dp[i - 2]
-    # Return the nth Fibonacci number
+    # Return the nth Fibonacci number (repeated calls are answered from the cache)
     return dp[n]
 
+
+def _fib_pair(n, mod, memo):
+    # Fast doubling: returns (F(n), F(n+1)) using
+    #   F(2k)   = F(k) * (2*F(k+1) - F(k))
+    #   F(2k+1) = F(k)^2 + F(k+1)^2
+    # Each step halves n, so this is O(log n) multiplications instead of O(n) additions.
+    # memo lets a batch of calls reuse pairs for the shared high bits of different n.
+    if n == 0:
+        return 0, 1
+    if memo is not None and n in memo:
+        return memo[n]
+    a, b = _fib_pair(n >> 1, mod, memo)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    pair = (d, c + d) if n & 1 else (c, d)
+    if mod is not None:
+        pair = (pair[0] % mod, pair[1] % mod)
+    if memo is not None:
+        memo[n] = pair
+    return pair
+
+
+def fibonacci_fast(n, mod=None):
+    # Same answer as fibonacci(n) but in O(log n) time and O(log n) memory,
+    # so F(10^9) mod m is instant. Pass mod to keep numbers small (e.g. for hashing).
+    if n <= 0:
+        return 0
+    return _fib_pair(n, mod, None)[0]
+
+
+def fibonacci_many(ns, mod=None):
+    # Answer a batch of Fibonacci queries at once.
+    # All queries share one memo of doubling steps, so numbers with common binary
+    # prefixes (which is most of them, e.g. n and n+1) reuse each other's work.
+    memo = {}
+    return [_fib_pair(n, mod, memo)[0] if n > 0 else 0 for n in ns]
+
+
+def _mat_mult(A, B, mod):
+    # Plain square matrix product on lists of lists (exact integers, optional modulus)
+    size = len(A)
+    C = [[0] * size for _ in range(size)]
+    for i in range(size):
+        Ai = A[i]
+        Ci = C[i]
+        for k in range(size):
+            a = Ai[k]
+            if a == 0:
+                continue
+            Bk = B[k]
+            for j in range(size):
+                Ci[j] += a * Bk[j]
+        if mod is not None:
+            C[i] = [x % mod for x in Ci]
+    return C
+
+
+def linear_recurrence(coeffs, initial, n, mod=None):
+    # Solve a(n) = coeffs[0]*a(n-1) + coeffs[1]*a(n-2) + ... + coeffs[d-1]*a(n-d)
+    # given initial = [a(0), a(1), ..., a(d-1)], using matrix exponentiation.
+    # Takes O(d^3 log n) instead of O(d n), so any constant-coefficient DP recurrence
+    # gets the same speedup as fibonacci_fast. Fibonacci is coeffs=[1, 1], initial=[0, 1].
+    d = len(coeffs)
+    if len(initial) != d:
+        raise ValueError("initial must have the same length as coeffs")
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n < d:
+        return initial[n] % mod if mod is not None else initial[n]
+
+    # Companion matrix: first row holds the coefficients, the rest shifts the state down
+    M = [[0] * d for _ in range(d)]
+    M[0] = list(coeffs)
+    for i in range(1, d):
+        M[i][i - 1] = 1
+
+    # Compute M^(n-d+1) by repeated squaring
+    power = n - d + 1
+    R = [[int(i == j) for j in range(d)] for i in range(d)]
+    while power:
+        if power & 1:
+            R = _mat_mult(R, M, mod)
+        M = _mat_mult(M, M, mod)
+        power >>= 1
+
+    # State vector is [a(d-1), a(d-2), ..., a(0)]; the top entry of R * state is a(n)
+    state = initial[::-1]
+    result = sum(R[0][j] * state[j] for j in range(d))
+    return result % mod if mod is not None else result
+
 if __name__ == "__main__":
     # This block will only run if the script is executed directly (not imported)
     # We'll print the first 10 Fibonacci numbers to show how our function works.
     for i in range(10):
         # For each number from 0 to 9, calculate and print its Fibonacci number
-        print(f"F({i}) = {fibonacci(i)}")
\ No newline at end of file
+        print(f"F({i}) = {fibonacci(i)}")
+
+    # The fast versions give the same numbers, but scale to huge n
+    print(f"F(90) = {fibonacci_fast(90)}")
+    print(f"F(10^18) mod 1_000_000_007 = {fibonacci_fast(10**18, mod=1_000_000_007)}")
+    print(f"Batch F(10..14) = {fibonacci_many(range(10, 15))}")
+    # Tribonacci via the generic solver: a(n) = a(n-1) + a(n-2) + a(n-3)
+    print(f"Tribonacci(30) = {linear_recurrence([1, 1, 1], [0, 0, 1], 30)}")
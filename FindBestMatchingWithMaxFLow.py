@@ -150,6 +150,130 @@ def max_bipartite_matching_via_flow(left_nodes, right_nodes, edges, show_steps=T
     return max_flow, matching_pairs
 
 
+# =========================
+# 大图版本：直接在 CSR 数组上跑（配合 LargeGraphs 的二进制图文件）
+# =========================
+
+def max_flow_csr(graph, s, t, initial_flow=None):
+    """
+    Edmonds–Karp 的数组版本，输入是 LargeGraphs.CSRGraph（可以是 load_graph 内存映射的文件），
+    graph.weights 当作容量。不构建任何“每个点一个 dict”的结构：
+      - 每条原边 e 配一条反向边 e+m（初始余量 0），按起点排序成残余网络的 CSR
+      - rev[a] 记录弧 a 的反向弧，增流时“正向减、反向加”
+    initial_flow：可选的初始可行流（与 graph.indices 同顺序），从它出发继续增广，
+    例如二分匹配先用贪心匹配打底，剩下的少量增广才交给 BFS。
+    返回：(max_flow, flow)，flow[e] 是第 e 条原边（与 graph.indices 同顺序）的流量
+    """
+    import numpy as np
+
+    n = graph.n
+    indptr = np.asarray(graph.indptr)
+    m = len(graph.indices)
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    dst = np.asarray(graph.indices, dtype=np.int64)
+    cap = np.asarray(graph.weights)
+
+    # 1) 残余网络：2m 条弧，按起点排序
+    tails = np.concatenate([src, dst])
+    heads = np.concatenate([dst, src])
+    if initial_flow is None:
+        initial_flow = np.zeros_like(cap)
+    initial_flow = np.asarray(initial_flow, dtype=cap.dtype)
+    caps = np.concatenate([cap - initial_flow, initial_flow])
+    order = np.argsort(tails, kind="stable")
+    pos = np.empty(2 * m, dtype=np.int64)
+    pos[order] = np.arange(2 * m)          # 弧编号 -> 排序后的位置
+    adj = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=n), out=adj[1:])
+
+    # BFS 里逐个访问，转成 list 比 NumPy 标量访问快得多
+    head = heads[order].tolist()
+    residual = caps[order].tolist()
+    rev = pos[(order + m) % (2 * m)].tolist()
+    adj = adj.tolist()
+
+    max_flow = initial_flow[src == s].sum().item()
+    while True:
+        # 2) BFS 找最短增广路，parent_arc[v] = 到达 v 的那条弧
+        parent_arc = [-1] * n
+        parent_arc[s] = -2
+        q = deque([s])
+        while q and parent_arc[t] == -1:
+            u = q.popleft()
+            for a in range(adj[u], adj[u + 1]):
+                v = head[a]
+                if residual[a] > 0 and parent_arc[v] == -1:
+                    parent_arc[v] = a
+                    if v == t:
+                        break
+                    q.append(v)
+        if parent_arc[t] == -1:
+            break
+
+        # 3) 回溯求瓶颈，再沿路径增流
+        bottleneck = float('inf')
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            bottleneck = min(bottleneck, residual[a])
+            v = head[rev[a]]
+        v = t
+        while v != s:
+            a = parent_arc[v]
+            residual[a] -= bottleneck
+            residual[rev[a]] += bottleneck
+            v = head[rev[a]]
+        max_flow += bottleneck
+
+    # 原边 e 的流量 = 容量 - 剩余容量
+    flow = cap - np.asarray(residual, dtype=cap.dtype)[pos[:m]]
+    return max_flow, flow
+
+
+def max_bipartite_matching_csr(graph, n_left):
+    """
+    二分图最大匹配的数组版本：graph 来自 LargeGraphs.bipartite_graph（或同格式的文件），
+    点 0..n_left-1 是左侧，其余是右侧，边从左指向右。
+    建模与 max_bipartite_matching_via_flow 相同：加源点 s、汇点 t，所有容量为 1。
+    返回：(匹配对数, pairs)，pairs 是 (k, 2) 数组，每行 (左点, 右点)
+    """
+    import numpy as np
+
+    from LargeGraphs import from_edges, to_edges
+
+    n = graph.n
+    s, t = n, n + 1
+    src, dst, _ = to_edges(graph)
+    left = np.arange(n_left)
+    right = np.arange(n_left, n)
+    all_src = np.concatenate([np.full(n_left, s), src, right])
+    all_dst = np.concatenate([left, dst, np.full(len(right), t)])
+    network = from_edges(n + 2, all_src, all_dst, np.ones(len(all_src), dtype=np.int64))
+
+    # 先贪心匹配打底：每个左点拿第一个还空着的右点（一遍扫描），
+    # 绝大部分匹配在这里完成，Edmonds–Karp 只需补上少数增广路
+    net_src, net_dst, _ = to_edges(network)
+    initial = np.zeros(len(net_src), dtype=np.int64)
+    taken = bytearray(n)
+    indptr = network.indptr.tolist()
+    heads = network.indices.tolist()
+    for u in range(n_left):
+        for e in range(indptr[u], indptr[u + 1]):
+            if not taken[heads[e]]:
+                taken[heads[e]] = 1
+                initial[e] = 1
+                break
+    used = np.flatnonzero(initial)
+    # 对应的 s -> 左点、右点 -> t 也各有 1 单位流
+    initial[(net_src == s) & np.isin(net_dst, net_src[used])] = 1
+    initial[(net_dst == t) & np.isin(net_src, net_dst[used])] = 1
+
+    size, flow = max_flow_csr(network, s, t, initial_flow=initial)
+    # 找出网络里“左 -> 右”且流量为 1 的边
+    matched = (flow == 1) & (net_src < n_left) & (net_dst >= n_left) & (net_dst < n)
+    return size, np.stack([net_src[matched], net_dst[matched]], axis=1)
+
+
 # =========================
 # 演示：现实化的“候选人-岗位”最大匹配
 # =========================
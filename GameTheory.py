@@ -1,4 +1,3 @@
-import nashpy as nash
 import numpy as np
 
 # 公司A、B的收益矩阵
@@ -11,13 +10,22 @@ A = np.array([
 # 玩家B的收益矩阵为A的相反数
 B = -A
 
-game = nash.Game(A, B)
 
-print("📊 公司定价博弈（Prisoner's Dilemma 版本）")
-print("公司A收益矩阵：\n", A)
-print("公司B收益矩阵：\n", B)
-print("-" * 40)
+def main():
+    # nashpy 只在真正求解时才导入，import 本模块不会触发任何计算
+    import nashpy as nash
 
-# 计算所有 Nash 均衡
-for eq in game.support_enumeration():
-    print("Nash 均衡：", eq)
\ No newline at end of file
+    game = nash.Game(A, B)
+
+    print("📊 公司定价博弈（Prisoner's Dilemma 版本）")
+    print("公司A收益矩阵：\n", A)
+    print("公司B收益矩阵：\n", B)
+    print("-" * 40)
+
+    # 计算所有 Nash 均衡
+    for eq in game.support_enumeration():
+        print("Nash 均衡：", eq)
+
+
+if __name__ == "__main__":
+    main()
@@ -36,12 +36,252 @@ def solve_milk_tea_problem():
     print(f"奶昔：{x[0]:.0f} 杯，巧克力奶茶：{x[1]:.0f} 杯，柠檬绿茶：{x[2]:.0f} 杯")
 
 
-import pandas as pd
-import matplotlib.pyplot as plt
+# Batched solvers: many small systems at once
+# ------------------------------------------
+# Calling np.linalg.solve once per system spends most of its time in Python
+# overhead for tiny n. Stacking k systems into a (k, n, n) array lets NumPy
+# solve them all in one call.
 
+def solve_batch(A, b, structure="auto"):
+    """
+    Solve k systems A[i] @ x[i] = b[i] at once.
 
+    A: (k, n, n) stacked matrices (a single (n, n) matrix also works)
+    b: (k, n) right-hand sides, or (k, n, m) for several right-hand sides each
+    structure: "general", "tridiagonal", or "auto" (use the tridiagonal fast path
+               when every entry outside the three middle diagonals is zero and
+               every matrix is diagonally dominant: all rows weakly, at least one
+               strictly, as in the milk tea system. The Thomas algorithm is stable
+               there without pivoting; if a pivot still comes out zero, e.g. for
+               a singular matrix, auto falls back to the general solver)
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if structure == "auto":
+        if _is_tridiagonal(A) and _is_diagonally_dominant(A):
+            try:
+                return solve_batch(A, b, "tridiagonal")
+            except np.linalg.LinAlgError:
+                pass
+        structure = "general"
+    if structure == "tridiagonal":
+        lower = np.diagonal(A, offset=-1, axis1=-2, axis2=-1)
+        diag = np.diagonal(A, axis1=-2, axis2=-1)
+        upper = np.diagonal(A, offset=1, axis1=-2, axis2=-1)
+        return solve_tridiagonal_batch(lower, diag, upper, b)
+    if structure != "general":
+        raise ValueError(f"unknown structure {structure!r}")
+    # np.linalg.solve treats a stacked b as matrices, so give vectors a trailing axis
+    if b.ndim == A.ndim - 1:
+        return np.linalg.solve(A, b[..., None])[..., 0]
+    return np.linalg.solve(A, b)
+
+
+def _is_tridiagonal(A):
+    n = A.shape[-1]
+    if n < 3:
+        return True
+    return not (np.triu(A, 2).any() or np.tril(A, -2).any())
+
+
+def _is_diagonally_dominant(A):
+    # Every row |a_ii| >= sum of the others, and in each matrix at least one row strictly
+    diag = np.abs(np.diagonal(A, axis1=-2, axis2=-1))
+    off = np.abs(A).sum(axis=-1) - diag
+    return bool(np.all(diag >= off) and np.all((diag > off).any(axis=-1)))
+
+
+def solve_tridiagonal_batch(lower, diag, upper, b):
+    """
+    Thomas algorithm, vectorized over the batch: O(n) per system instead of O(n^3).
+
+    lower: (k, n-1) sub-diagonal, diag: (k, n) main diagonal, upper: (k, n-1) super-diagonal
+    b:     (k, n) or (k, n, m) right-hand sides
+    No pivoting, so the systems should be diagonally dominant (or otherwise
+    well-behaved) like the milk tea one; use structure="general" if not.
+    Raises LinAlgError when a pivot comes out zero or non-finite.
+    """
+    lower = np.asarray(lower, dtype=float)
+    diag = np.asarray(diag, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    b = np.asarray(b, dtype=float)
+    vector_rhs = b.ndim == diag.ndim
+    if vector_rhs:
+        b = b[..., None]
+
+    n = diag.shape[-1]
+    def check(pivot):
+        if not np.all(np.isfinite(pivot) & (pivot != 0)):
+            raise np.linalg.LinAlgError("zero pivot in Thomas algorithm; use structure='general'")
+
+    c = np.empty_like(diag)     # modified super-diagonal
+    d = np.empty_like(b)        # modified right-hand side
+    check(diag[..., 0])
+    c[..., 0] = upper[..., 0] / diag[..., 0] if n > 1 else 0
+    d[..., 0, :] = b[..., 0, :] / diag[..., 0, None]
+    # Forward sweep: eliminate the sub-diagonal
+    for i in range(1, n):
+        denom = diag[..., i] - lower[..., i - 1] * c[..., i - 1]
+        check(denom)
+        if i < n - 1:
+            c[..., i] = upper[..., i] / denom
+        d[..., i, :] = (b[..., i, :] - lower[..., i - 1, None] * d[..., i - 1, :]) / denom[..., None]
+    # Back substitution
+    x = np.empty_like(d)
+    x[..., n - 1, :] = d[..., n - 1, :]
+    for i in range(n - 2, -1, -1):
+        x[..., i, :] = d[..., i, :] - c[..., i, None] * x[..., i + 1, :]
+    return x[..., 0] if vector_rhs else x
+
+
+def lu_factor_batch(A):
+    """
+    LU factorization with partial pivoting for stacked (k, n, n) matrices.
+    Returns (LU, perm): L (unit lower) and U packed in one array, and the row
+    permutation of each system. Factor once, then call lu_solve_batch for every
+    new right-hand side at O(n^2) instead of O(n^3).
+    """
+    LU = np.array(A, dtype=float)
+    if LU.ndim == 2:
+        LU = LU[None]
+    k, n, _ = LU.shape
+    perm = np.tile(np.arange(n), (k, 1))
+    rows = np.arange(k)
+    for j in range(n):
+        # Pick the largest pivot in column j for every system at once
+        p = j + np.abs(LU[:, j:, j]).argmax(axis=1)
+        LU[rows, j, :], LU[rows, p, :] = LU[rows, p, :], LU[rows, j, :].copy()
+        perm[rows, j], perm[rows, p] = perm[rows, p], perm[rows, j].copy()
+        if np.any(LU[:, j, j] == 0):
+            raise np.linalg.LinAlgError("Singular matrix")
+        LU[:, j + 1:, j] /= LU[:, j, j, None]
+        LU[:, j + 1:, j + 1:] -= LU[:, j + 1:, j, None] * LU[:, j, None, j + 1:]
+    return LU, perm
+
+
+def lu_solve_batch(factors, b):
+    """Solve with factors from lu_factor_batch; b is (k, n) or (k, n, m)."""
+    LU, perm = factors
+    b = np.asarray(b, dtype=float)
+    if b.ndim == 1:
+        b = b[None]
+    vector_rhs = b.ndim == 2
+    if vector_rhs:
+        b = b[..., None]
+    k, n, _ = LU.shape
+    y = np.take_along_axis(b, perm[..., None], axis=1)
+    # Forward substitution with the unit lower triangle
+    for i in range(1, n):
+        y[:, i, :] -= np.einsum("kj,kjm->km", LU[:, i, :i], y[:, :i, :])
+    # Back substitution with the upper triangle
+    for i in range(n - 1, -1, -1):
+        if i < n - 1:
+            y[:, i, :] -= np.einsum("kj,kjm->km", LU[:, i, i + 1:], y[:, i + 1:, :])
+        y[:, i, :] /= LU[:, i, i, None]
+    return y[..., 0] if vector_rhs else y
+
+
+_factor_cache = {}
+_FACTOR_CACHE_SIZE = 32
+
+
+def solve_batch_cached(A, b):
+    """
+    Like solve_batch(A, b, "general"), but remembers the LU factors of A.
+    Pricing runs keep the same matrices and only change the right-hand side,
+    so after the first call each solve skips the O(n^3) factorization.
+    The cache key is a hash of A's bytes; the oldest entry is dropped when full.
+    """
+    import hashlib
+
+    A = np.ascontiguousarray(A, dtype=float)
+    key = (A.shape, hashlib.sha1(A.tobytes()).hexdigest())
+    factors = _factor_cache.get(key)
+    if factors is None:
+        factors = lu_factor_batch(A)
+        if len(_factor_cache) >= _FACTOR_CACHE_SIZE:
+            _factor_cache.pop(next(iter(_factor_cache)))
+        _factor_cache[key] = factors
+    if A.ndim == 2:
+        # One system: b is a vector (n,) or a matrix (n, m), never a batch
+        return lu_solve_batch(factors, np.asarray(b, dtype=float)[None])[0]
+    return lu_solve_batch(factors, b)
+
+
+# pandas / matplotlib are only needed for the sales functions below, so they are
+# imported inside those functions: importing this module (e.g. for range_test or
+# the solvers) stays fast.
+
+PRODUCT_COLUMNS = ['Milkshake', 'ChocolateMilkTea', 'LemonGreenTea']
+
+
+def update_daily_totals(totals, chunk, product_cols=PRODUCT_COLUMNS, date_col='Date'):
+    """
+    Fold one chunk of sales rows into the running per-day totals.
+
+    totals: DataFrame indexed by date (one column per product plus TotalSales),
+            or None for the first chunk
+    chunk:  DataFrame with a date column and the product columns
+    Only the per-day sums of the chunk are kept, so memory grows with the number
+    of distinct days, not with the number of rows read.
+    """
+    import pandas as pd
+
+    dates = pd.to_datetime(chunk[date_col])
+    daily = chunk[list(product_cols)].groupby(dates).sum()
+    daily.index.name = date_col
+    daily['TotalSales'] = daily.sum(axis=1)
+    if totals is None:
+        return daily
+    return pd.concat([totals, daily]).groupby(level=0).sum()
+
+
+def stream_daily_totals(paths, chunksize=100_000, product_cols=PRODUCT_COLUMNS, date_col='Date'):
+    """
+    Read one or more sales CSVs in chunks and return the daily totals, sorted by date.
+    Files can be far larger than memory: only `chunksize` rows are held at a time.
+    """
+    import pandas as pd
+
+    if isinstance(paths, str):
+        paths = [paths]
+    usecols = [date_col] + list(product_cols)
+    totals = None
+    for path in paths:
+        for chunk in pd.read_csv(path, usecols=usecols, chunksize=chunksize):
+            totals = update_daily_totals(totals, chunk, product_cols, date_col)
+    if totals is None:
+        return pd.DataFrame(columns=list(product_cols) + ['TotalSales'])
+    return totals.sort_index()
+
+
+def plot_sales_trend(daily, path):
+    """
+    Save the daily total sales trend to an image file (png/svg/pdf by extension).
+    Renders on its own Figure with an Agg canvas: headless and never blocks, and
+    unlike matplotlib.use('Agg') it leaves the process-wide backend (and any
+    interactive plotting elsewhere) untouched.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(daily.index, daily['TotalSales'], marker='o', label='Total Sales')
+    ax.set_title('Daily Total Sales Trend')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Cups Sold')
+    ax.grid(True)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    return path
+
+
+def analyze_sales(plot_path=None):
+    import pandas as pd
 
-def analyze_sales():
     # Step 1: Create sales data
     data = {
         'Date': ['2025-10-01', '2025-10-02', '2025-10-03'],
@@ -51,28 +291,22 @@ def analyze_sales():
     }
     df = pd.DataFrame(data)
 
-    # Step 2: Convert date strings to datetime objects
-    df['Date'] = pd.to_datetime(df['Date'])
-
-    # Step 3: Calculate total daily sales
-    df['TotalSales'] = df[['Milkshake', 'ChocolateMilkTea', 'LemonGreenTea']].sum(axis=1)
+    # Step 2-3: Convert dates and calculate total daily sales
+    # (same code path as the streaming CSV aggregator, just with one chunk)
+    daily = update_daily_totals(None, df)
 
     # Step 4: Print summary
     print("Daily Sales Summary:")
-    print(df)
-
-    # Step 5: Plot total sales trend
-    plt.figure(figsize=(8, 5))
-    plt.plot(df['Date'], df['TotalSales'], marker='o', label='Total Sales')
-    plt.title('Daily Total Sales Trend')
-    plt.xlabel('Date')
-    plt.ylabel('Cups Sold')
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    print(daily)
+
+    # Step 5: Plot total sales trend (optional, written to a file instead of a blocking window)
+    if plot_path is not None:
+        plot_sales_trend(daily, plot_path)
+        print(f"Saved plot to {plot_path}")
+    return daily
 
 def range_test():
+    # One quick run; MathForMLBench.bench_range does repeated timings across sizes
     a = list(range(1000000))
     b = np.array(a)
 
@@ -88,7 +322,7 @@ def range_test():
 
 # Run the main function
 if __name__ == "__main__":
-    # analyze_sales()
+    # analyze_sales(plot_path="sales.png")
     # solve_milk_tea_problem()
     # print(pd.__version__)
     # print(np.__version__)
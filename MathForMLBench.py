@@ -0,0 +1,71 @@
+"""
+Repeatable timings for the MathForML examples.
+
+range_test in MathForML times one run of one size with time.time(), which is
+too noisy to compare anything. Here every measurement uses timeit (auto-picked
+loop count, best of several repeats) and sweeps a range of sizes:
+
+- bench_range:   list comprehension vs NumPy for "multiply every element by 2"
+- bench_solvers: one np.linalg.solve per system vs the batched solvers
+
+Run: python MathForMLBench.py
+"""
+
+import timeit
+
+import numpy as np
+
+from MathForML import solve_batch, solve_batch_cached
+
+
+def best_time(fn, repeat=5):
+    """Best per-call time of fn in seconds (timeit picks how many calls per repeat)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bench_range(sizes=(10**3, 10**4, 10**5, 10**6), repeat=5):
+    """list vs NumPy for x * 2, across sizes. Returns a list of result dicts."""
+    results = []
+    print(f"{'n':>10} {'list (ms)':>12} {'numpy (ms)':>12} {'speedup':>9}")
+    for n in sizes:
+        a = list(range(n))
+        b = np.arange(n)
+        t_list = best_time(lambda: [x * 2 for x in a], repeat)
+        t_np = best_time(lambda: b * 2, repeat)
+        results.append({"n": n, "list_s": t_list, "numpy_s": t_np})
+        print(f"{n:>10} {t_list * 1e3:>12.3f} {t_np * 1e3:>12.3f} {t_list / t_np:>8.1f}x")
+    return results
+
+
+def bench_solvers(batch_sizes=(100, 1000, 10000), n=3, repeat=3, seed=0):
+    """
+    Solve k random tridiagonal n x n systems (like the milk tea one) with:
+      loop       - np.linalg.solve once per system
+      batched    - solve_batch(..., "general"), one stacked call
+      cached     - solve_batch_cached, factors reused across calls
+      tridiagonal - solve_batch(..., "tridiagonal"), Thomas algorithm
+    Prints systems solved per second.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    print(f"{'k':>8} {'loop':>12} {'batched':>12} {'cached':>12} {'tridiagonal':>12}   (systems/s)")
+    for k in batch_sizes:
+        A = np.triu(np.tril(rng.standard_normal((k, n, n)), 1), -1) + 4 * np.eye(n)
+        b = rng.standard_normal((k, n))
+        timings = {
+            "loop": best_time(lambda: [np.linalg.solve(A[i], b[i]) for i in range(k)], repeat),
+            "batched": best_time(lambda: solve_batch(A, b, "general"), repeat),
+            "cached": best_time(lambda: solve_batch_cached(A, b), repeat),
+            "tridiagonal": best_time(lambda: solve_batch(A, b, "tridiagonal"), repeat),
+        }
+        results.append({"k": k, "n": n, **timings})
+        print(f"{k:>8} " + " ".join(f"{k / t:>12,.0f}" for t in timings.values()))
+    return results
+
+
+if __name__ == "__main__":
+    bench_range()
+    print()
+    bench_solvers()
@@ -0,0 +1,225 @@
+"""
+大规模博弈的 Nash 均衡求解（GameTheory.py 的可扩展版本）
+
+GameTheory.py 用 nashpy 的 support_enumeration 枚举所有支撑集，策略数一多就指数爆炸，
+50x50 的定价博弈根本算不完。这里提供：
+
+1) iterated_dominance：反复删除被严格占优的纯策略（预处理，先把博弈变小）
+2) lemke_howson：Lemke–Howson 互补转轴算法，找一个均衡，一般博弈也能用
+3) solve_zero_sum：零和博弈直接解线性规划（极小极大定理），多项式时间
+4) solve_game / solve_games：自动选方法；批量求解多个收益矩阵（可多进程并行），
+   返回结果而不是打印
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# 求解结果：行玩家混合策略、列玩家混合策略、两人的期望收益、所用方法
+Equilibrium = namedtuple("Equilibrium", ["row_strategy", "col_strategy", "row_payoff", "col_payoff", "method"])
+
+
+def iterated_dominance(A, B):
+    """
+    反复删除被严格占优的纯策略，直到删不动为止。
+    - 行策略 i 被严格占优：存在行策略 j，使 A[j, :] > A[i, :] 对所有列都成立
+    - 列策略 i 被严格占优：存在列策略 j，使 B[:, j] > B[:, i] 对所有行都成立
+    严格占优的策略在任何均衡里概率都是 0，所以删掉不会丢失均衡。
+    返回：(A 子矩阵, B 子矩阵, 保留的行下标, 保留的列下标)
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    rows = np.arange(A.shape[0])
+    cols = np.arange(A.shape[1])
+    while True:
+        sub_A = A[np.ix_(rows, cols)]
+        sub_B = B[np.ix_(rows, cols)]
+        # better[j, i] = 行 j 是否在每一列上都严格优于行 i（一次广播比较所有行对）
+        better = (sub_A[:, None, :] > sub_A[None, :, :]).all(axis=2)
+        row_dominated = better.any(axis=0)
+        better = (sub_B.T[:, None, :] > sub_B.T[None, :, :]).all(axis=2)
+        col_dominated = better.any(axis=0)
+        if not row_dominated.any() and not col_dominated.any():
+            return sub_A, sub_B, rows, cols
+        rows = rows[~row_dominated]
+        cols = cols[~col_dominated]
+
+
+def _pivot(tableau, basis, entering, slack_cols, eps=1e-12):
+    """
+    在单纯形表上做一次转轴：让 entering 进基，返回出基的标号。
+    比值检验用字典序规则（先比右端项，再比松弛列），避免退化时循环。
+    """
+    column = tableau[:, entering]
+    candidates = np.flatnonzero(column > eps)
+    if candidates.size == 0:
+        raise np.linalg.LinAlgError("Lemke–Howson 无界（收益矩阵有问题）")
+    # 每个候选行的字典序向量：(rhs, 松弛列...) / 主元
+    keys = np.column_stack([tableau[candidates, -1], tableau[np.ix_(candidates, slack_cols)]])
+    keys /= column[candidates, None]
+    best = 0
+    for i in range(1, len(candidates)):
+        diff = keys[i] - keys[best]
+        nz = np.flatnonzero(np.abs(diff) > eps)
+        if nz.size and diff[nz[0]] < 0:
+            best = i
+    row = candidates[best]
+
+    tableau[row] /= tableau[row, entering]
+    others = np.arange(tableau.shape[0]) != row
+    tableau[others] -= np.outer(tableau[others, entering], tableau[row])
+    leaving = basis[row]
+    basis[row] = entering
+    return leaving
+
+
+def lemke_howson(A, B, initial_dropped_label=0, max_pivots=100000):
+    """
+    Lemke–Howson 算法求双矩阵博弈 (A, B) 的一个 Nash 均衡。
+    标号 0..m-1 对应行策略，m..m+n-1 对应列策略。
+    思路：
+      - 多面体 P = {x >= 0 : B^T x <= 1}，Q = {y >= 0 : A y <= 1}
+      - 从 (0, 0) 出发，“丢掉”一个标号，然后在两个单纯形表之间交替转轴：
+        一边出基的标号就在另一边进基，直到丢掉的那个标号出基，此时所有标号齐全 → 均衡
+    每次转轴只是一次矩阵行变换，50x50 的博弈通常几十次转轴就结束。
+    返回：(x, y) 两个混合策略（概率向量）
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    m, n = A.shape
+    # 把收益平移成正数，保证两个多面体有界（平移不改变均衡）
+    A = A - A.min() + 1
+    B = B - B.min() + 1
+
+    # 单纯形表的列按标号排列，最后一列是右端项
+    # P 表：[B^T | I_n | 1]，初始基 = 松弛变量（标号 m..m+n-1）
+    # Q 表：[I_m | A | 1]，  初始基 = 松弛变量（标号 0..m-1）
+    tab_p = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+    tab_q = np.hstack([np.eye(m), A, np.ones((m, 1))])
+    basis_p = list(range(m, m + n))
+    basis_q = list(range(m))
+    slack_p = np.arange(m, m + n)
+    slack_q = np.arange(m)
+
+    k = initial_dropped_label
+    entering = k
+    in_p = k < m   # 行策略的标号先在 P 里进基，列策略的标号先在 Q 里进基
+    for _ in range(max_pivots):
+        if in_p:
+            leaving = _pivot(tab_p, basis_p, entering, slack_p)
+        else:
+            leaving = _pivot(tab_q, basis_q, entering, slack_q)
+        if leaving == k:
+            break
+        entering = leaving
+        in_p = not in_p
+    else:
+        raise RuntimeError("Lemke–Howson 超过最大转轴次数")
+
+    x = np.zeros(m)
+    for row, label in enumerate(basis_p):
+        if label < m:
+            x[label] = tab_p[row, -1]
+    y = np.zeros(n)
+    for row, label in enumerate(basis_q):
+        if label >= m:
+            y[label - m] = tab_q[row, -1]
+    return x / x.sum(), y / y.sum()
+
+
+def solve_zero_sum(A):
+    """
+    零和博弈（B = -A）用线性规划直接求解：
+        max v  s.t.  A^T x >= v,  sum(x) = 1,  x >= 0
+    列玩家的最优策略就是不等式约束的对偶变量，一次 LP 两边都有了。
+    返回：(x, y, value)，value 是行玩家的博弈值。
+    """
+    from scipy.optimize import linprog
+
+    A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    # 变量：[x_1..x_m, v]，目标：最小化 -v
+    c = np.zeros(m + 1)
+    c[-1] = -1
+    A_ub = np.hstack([-A.T, np.ones((n, 1))])     # v - (A^T x)_j <= 0
+    b_ub = np.zeros(n)
+    A_eq = np.hstack([np.ones((1, m)), np.zeros((1, 1))])
+    bounds = [(0, None)] * m + [(None, None)]
+    res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[1], bounds=bounds, method="highs")
+    if not res.success:
+        raise RuntimeError(f"线性规划求解失败：{res.message}")
+    x = np.clip(res.x[:m], 0, None)
+    y = np.clip(-res.ineqlin.marginals, 0, None)
+    return x / x.sum(), y / y.sum(), res.x[-1]
+
+
+def solve_game(A, B=None, method="auto", eliminate=True):
+    """
+    求一个博弈的 Nash 均衡，返回 Equilibrium（不打印）。
+    - B 省略时视为零和博弈 B = -A
+    - method："auto"（零和用 LP，否则 Lemke–Howson）、"lp"、"lemke_howson"
+    - eliminate：先做严格占优删除，在小博弈上求解后再把策略补回原来的维度
+    """
+    A = np.asarray(A, dtype=float)
+    B = -A if B is None else np.asarray(B, dtype=float)
+    if method == "auto":
+        method = "lp" if np.allclose(A + B, 0) else "lemke_howson"
+
+    rows, cols = np.arange(A.shape[0]), np.arange(A.shape[1])
+    sub_A, sub_B = A, B
+    if eliminate:
+        sub_A, sub_B, rows, cols = iterated_dominance(A, B)
+
+    if method == "lp":
+        if not np.allclose(sub_A + sub_B, 0):
+            raise ValueError("LP 方法只适用于零和博弈")
+        sub_x, sub_y, _ = solve_zero_sum(sub_A)
+    elif method == "lemke_howson":
+        sub_x, sub_y = lemke_howson(sub_A, sub_B)
+    else:
+        raise ValueError(f"未知方法 {method!r}")
+
+    x = np.zeros(A.shape[0])
+    y = np.zeros(A.shape[1])
+    x[rows] = sub_x
+    y[cols] = sub_y
+    return Equilibrium(x, y, float(x @ A @ y), float(x @ B @ y), method)
+
+
+def _solve_one(args):
+    A, B, method, eliminate = args
+    return solve_game(A, B, method, eliminate)
+
+
+def solve_games(games, method="auto", eliminate=True, processes=None):
+    """
+    批量求解：games 是 [(A, B), ...] 或 [A, ...]（零和）。
+    processes=1 时顺序求解；否则用进程池并行（None 表示用全部 CPU 核）。
+    返回与输入同顺序的 Equilibrium 列表。
+    """
+    jobs = []
+    for g in games:
+        A, B = g if isinstance(g, tuple) else (g, None)
+        jobs.append((A, B, method, eliminate))
+    if processes == 1 or len(jobs) <= 1:
+        return [_solve_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_solve_one, jobs, chunksize=max(1, len(jobs) // 32)))
+
+
+if __name__ == "__main__":
+    # GameTheory.py 里的石头剪刀布定价博弈：零和，走 LP
+    A = np.array([
+        [0, 1, -1],
+        [-1, 0, 1],
+        [1, -1, 0]
+    ])
+    print("石头剪刀布：", solve_game(A))
+
+    # 50x50 的随机定价博弈（非零和），Lemke–Howson 一次就能找到一个均衡
+    rng = np.random.default_rng(0)
+    games = [(rng.integers(0, 100, (50, 50)), rng.integers(0, 100, (50, 50))) for _ in range(8)]
+    for eq in solve_games(games):
+        print(f"支撑集大小 {np.count_nonzero(eq.row_strategy)}x{np.count_nonzero(eq.col_strategy)}，"
+              f"收益 A={eq.row_payoff:.2f}，B={eq.col_payoff:.2f}")
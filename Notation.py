@@ -1,6 +1,7 @@
-import torch
-
 def main():
+    # torch 很重（导入要好几秒），只在真正运行示例时才导入
+    import torch
+
     # 标量 (Scalar)
     a = 3.14  # 标量，单个数值
     print("标量 a:")
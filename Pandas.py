@@ -1,6 +1,130 @@
+import json
+import os
+
+import numpy as np
 import pandas as pd
 
-def read_demo():
+AUTO_MPG_URL = "https://archive.ics.uci.edu/ml/machine-learning-databases/auto-mpg/auto-mpg.data"
+AUTO_MPG_COLUMNS = [
+    "mpg", "cylinders", "displacement", "horsepower",
+    "weight", "acceleration", "model year", "origin", "car name"
+]
+# Explicit compact dtypes instead of letting pandas infer int64/float64/object:
+# float32 for measurements, int8 for small counts, categoricals for repeated labels.
+AUTO_MPG_DTYPES = {
+    "mpg": "float32",
+    "cylinders": "int8",
+    "displacement": "float32",
+    "horsepower": "float32",   # has missing values ("?"), so it can't be an int
+    "weight": "float32",
+    "acceleration": "float32",
+    "model year": "int8",
+    "origin": "category",
+    "car name": "category",
+}
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "auto-mpg")
+
+
+def parse_auto_mpg(path):
+    """Parse the raw whitespace-separated auto-mpg file with explicit dtypes."""
+    return pd.read_csv(path, names=AUTO_MPG_COLUMNS, sep=r"\s+", na_values="?",
+                       dtype=AUTO_MPG_DTYPES)
+
+
+def save_columns(df, directory):
+    """
+    Save a DataFrame as one .npy file per column (columnar, memory-mappable).
+    Categorical columns are stored as integer codes plus a separate categories
+    file, so nothing needs pickling.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for i, col in enumerate(df.columns):
+        base = os.path.join(directory, f"{i:02d}")
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            np.save(base + ".codes.npy", df[col].cat.codes.to_numpy())
+            np.save(base + ".categories.npy", df[col].cat.categories.to_numpy().astype(str))
+        else:
+            np.save(base + ".npy", df[col].to_numpy())
+
+
+def load_columns(directory, columns):
+    """Load a DataFrame written by save_columns; numeric columns are memory-mapped."""
+    data = {}
+    for i, col in enumerate(columns):
+        base = os.path.join(directory, f"{i:02d}")
+        if os.path.exists(base + ".codes.npy"):
+            codes = np.load(base + ".codes.npy")
+            categories = np.load(base + ".categories.npy")
+            data[col] = pd.Categorical.from_codes(codes, categories)
+        else:
+            data[col] = np.load(base + ".npy", mmap_mode="r")
+    return pd.DataFrame(data, copy=False)
+
+
+def load_auto_mpg(path=None, cache_dir=DEFAULT_CACHE_DIR, refresh=False):
+    """
+    Load the auto-mpg dataset, offline after the first run.
+
+    path:      local copy of auto-mpg.data. If omitted, the raw file is looked up in
+               cache_dir and downloaded from UCI only if it isn't there yet.
+    cache_dir: where the raw file and the parsed columnar cache live
+               (None disables caching and just parses `path`).
+    refresh:   ignore the parsed cache and re-parse.
+
+    After the first parse the typed columns are cached as .npy files, so later
+    loads skip CSV parsing entirely and map the numeric columns straight from disk.
+    """
+    if cache_dir is None:
+        if path is None:
+            raise ValueError("need a path when caching is disabled")
+        return parse_auto_mpg(path)
+
+    parsed_dir = os.path.join(cache_dir, "columns")
+    if path is None:
+        path = os.path.join(cache_dir, "auto-mpg.data")
+        if not os.path.exists(path):
+            from urllib.request import urlretrieve
+
+            os.makedirs(cache_dir, exist_ok=True)
+            # Download to a temp file first so an interrupted download never
+            # leaves a truncated auto-mpg.data that later runs would trust
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                urlretrieve(AUTO_MPG_URL, tmp)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+    # The marker records which source file the cache was built from; re-parse
+    # if it is a different file or that file changed since
+    marker = os.path.join(parsed_dir, "done")
+    stat = os.stat(path)
+    source = {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if not refresh and _read_marker(marker) == source:
+        return load_columns(parsed_dir, AUTO_MPG_COLUMNS)
+
+    df = parse_auto_mpg(path)
+    # Invalidate first, so a crash mid-rewrite never leaves old and new columns
+    # looking like a valid cache
+    if os.path.exists(marker):
+        os.remove(marker)
+    save_columns(df, parsed_dir)
+    # Written last, so a half-finished cache is never treated as valid
+    with open(marker, "w") as f:
+        json.dump(source, f)
+    return df
+
+
+def _read_marker(marker):
+    try:
+        with open(marker) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_demo(path=None, cache_dir=DEFAULT_CACHE_DIR):
     # df = pd.read_csv("/Users/lanzy/Downloads/student+performance/student/student-mat.csv", sep=";")
     # df.columns = df.columns.str.strip()
     # print(df)
@@ -12,13 +136,8 @@ def read_demo():
     # print(df.max())
     # print(df.describe())
 
-    url = "https://archive.ics.uci.edu/ml/machine-learning-databases/auto-mpg/auto-mpg.data"
-    column_names = [
-        "mpg", "cylinders", "displacement", "horsepower",
-        "weight", "acceleration", "model year", "origin", "car name"
-    ]
-
-    df = pd.read_csv(url, names=column_names, delim_whitespace=True, na_values="?")
+    # Downloads once into cache_dir (or uses a local path), then loads from the typed cache
+    df = load_auto_mpg(path, cache_dir)
 
     print(df.head())
     print(df.info())
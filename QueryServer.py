@@ -0,0 +1,451 @@
+"""
+Asyncio query server for shortest paths, max flow and bipartite matching.
+
+The graphs live in server memory; clients send one JSON object per line over
+TCP and get one JSON line back (responses carry the request "id", so a client
+may pipeline many requests on one connection and match answers out of order).
+
+Requests:
+  {"op": "shortest_path", "graph": "city", "source": "A", "target": "C"}
+  {"op": "max_flow", "edges": [[u, v, cap], ...], "source": s, "sink": t}
+  {"op": "matching", "left": [...], "right": [...], "edges": [[u, v], ...]}
+  {"op": "graphs"}     names of the loaded graphs
+  {"op": "stats"}      per-endpoint latency histograms and coalescing counters
+Responses are {"id": ..., "ok": true, ...} or {"id": ..., "ok": false, "error": "..."}.
+
+How concurrency is handled:
+  - shortest_path: concurrent requests for the same (graph, source) share one
+    Dijkstra run (it yields the whole shortest-path tree, every waiter then
+    reconstructs its own target). For a CSRGraph memory-mapped from a file
+    (LargeGraphs.load_graph) the search runs in the process pool: workers map
+    the same file, so only the source id travels to them. Other graphs are
+    searched in a thread, which keeps the loop accepting requests but is
+    GIL-bound: concurrent searches share one core and slow the loop down.
+  - max_flow / matching: CPU-heavy and self-contained, so they go to a
+    ProcessPoolExecutor and never block other requests.
+
+Graphs are either the dict format of DijkstraShortestPathsAlgorithm.dijkstra
+(node -> [(neighbor, weight), ...]) or a LargeGraphs.CSRGraph (e.g. a
+memory-mapped file), which is searched with dijkstra_csr.
+
+Run: python QueryServer.py            localhost demo with concurrent clients
+     python QueryServer.py --serve    serve a demo graph until interrupted
+"""
+
+import asyncio
+import bisect
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from DijkstraShortestPathsAlgorithm import (dijkstra, dijkstra_csr, reconstruct_path,
+                                            reconstruct_path_csr)
+from FindBestMatchingWithMaxFLow import edmonds_karp_max_flow, max_bipartite_matching_via_flow
+
+# Histogram bucket upper bounds in ms: four per doubling from 0.1 ms to ~26 s, then overflow
+BUCKETS_MS = [round(0.1 * 2 ** (k / 4), 3) for k in range(73)]
+
+
+class LatencyHistogram:
+    """Fixed log-spaced latency buckets (cheap to record, easy to read)."""
+
+    def __init__(self, bounds=BUCKETS_MS):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (q in 0..100)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, c in zip(self.bounds, self.counts):
+            seen += c
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self):
+        buckets = {f"<={b:g}ms": c for b, c in zip(self.bounds, self.counts) if c}
+        if self.counts[-1]:
+            buckets[f">{self.bounds[-1]:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+            "buckets": buckets,
+        }
+
+
+# =========================
+# Solvers run in worker processes (must be top-level to be picklable)
+# =========================
+
+def _solve_max_flow(edges, source, sink):
+    graph = {}
+    for u, v, cap in edges:
+        graph.setdefault(u, {})
+        graph.setdefault(v, {})
+        graph[u][v] = graph[u].get(v, 0) + cap
+    if source not in graph or sink not in graph:
+        raise ValueError("source and sink must appear in the edge list")
+    value, flow = edmonds_karp_max_flow(graph, source, sink)
+    used = [[u, v, f] for u, row in flow.items() for v, f in row.items() if f > 0]
+    return {"max_flow": value, "flow": used}
+
+
+def _solve_matching(left, right, edges):
+    # Sets: the solver checks membership for every edge
+    size, pairs = max_bipartite_matching_via_flow(set(left), set(right),
+                                                  [tuple(e) for e in edges], show_steps=False)
+    return {"size": size, "pairs": [list(p) for p in pairs]}
+
+
+def _shortest_path_tree(graph, source):
+    if isinstance(graph, dict):
+        if source not in graph:
+            raise KeyError(f"unknown source {source!r}")
+        return dijkstra(graph, source)
+    if not 0 <= source < graph.n:
+        raise KeyError(f"unknown source {source!r}")
+    return dijkstra_csr(graph, source)
+
+
+# Graphs a worker process has mapped, keyed by (path, size, mtime_ns)
+_worker_graphs = {}
+
+
+def _graph_file(graph):
+    """(path, size, mtime_ns) of the file a CSRGraph is memory-mapped from, else None."""
+    import os
+
+    path = getattr(graph.indptr, "filename", None) if not isinstance(graph, dict) else None
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def _file_shortest_path_tree(file_key, source):
+    from LargeGraphs import load_graph
+
+    graph = _worker_graphs.get(file_key)
+    if graph is None:
+        # Mapping is free; a rewritten file gets a new key and is mapped again
+        graph = _worker_graphs[file_key] = load_graph(file_key[0])
+    return _shortest_path_tree(graph, source)
+
+
+def _route(graph, tree, target):
+    """Distance and path to target from a shortest-path tree (None if unreachable)."""
+    dist, prev = tree
+    if isinstance(graph, dict):
+        if target not in dist:
+            raise KeyError(f"unknown target {target!r}")
+        d = dist[target]
+        path = reconstruct_path(prev, target)
+    else:
+        if not 0 <= target < graph.n:
+            raise KeyError(f"unknown target {target!r}")
+        d = float(dist[target])
+        path = reconstruct_path_csr(prev, target)
+    if d == float('inf'):
+        return {"distance": None, "path": []}
+    return {"distance": d, "path": path}
+
+
+class QueryServer:
+    """
+    server = QueryServer({"city": graph}); port = await server.start()
+    ... await server.close()
+    """
+
+    def __init__(self, graphs=None, processes=None):
+        self.graphs = dict(graphs or {})
+        self.processes = processes
+        self.histograms = {}
+        self.searches = 0       # Dijkstra runs actually executed
+        self.coalesced = 0      # shortest_path requests that joined a running search
+        self._inflight = {}     # (graph name, source) -> Future of the shortest-path tree
+        self._pool = None
+        self._server = None
+        self._connections = {}  # handler task -> its StreamWriter
+        self._handlers = {
+            "shortest_path": self._shortest_path,
+            "max_flow": self._max_flow,
+            "matching": self._matching,
+            "graphs": self._list_graphs,
+            "stats": self._stats,
+        }
+
+    def add_graph(self, name, graph):
+        """Load or replace a graph. Searches already running finish on the old one."""
+        self.graphs[name] = graph
+        # New requests must not join those searches
+        for key in [k for k in self._inflight if k[0] == name]:
+            del self._inflight[key]
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start listening; returns the bound port (port=0 picks a free one)."""
+        self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        # Closing the writers ends each handler's read loop; wait for their replies
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    # ----- connection handling -----
+
+    async def _handle_connection(self, reader, writer):
+        write_lock = asyncio.Lock()
+        tasks = set()
+        me = asyncio.current_task()
+        self._connections[me] = writer
+        try:
+            while line := await reader.readline():
+                # One task per request: a slow solve doesn't hold up the next line
+                task = asyncio.create_task(self._answer(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.pop(me, None)
+            writer.close()
+
+    async def _answer(self, line, writer, write_lock):
+        start = time.perf_counter()
+        request_id = op = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            request_id = request.get("id")
+            op = request.get("op")
+            handler = self._handlers.get(op) if isinstance(op, str) else None
+            if handler is None:
+                raise ValueError(f"unknown op {op!r}")
+            response = {"id": request_id, "ok": True, **await handler(request)}
+        except Exception as exc:
+            # Every request gets an answer: a pipelined client waits on its id
+            response = {"id": request_id, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        endpoint = op if isinstance(op, str) and op in self._handlers else "invalid"
+        self.histograms.setdefault(endpoint, LatencyHistogram()).record(time.perf_counter() - start)
+        if writer.is_closing():
+            return
+        async with write_lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    # ----- endpoints -----
+
+    async def _shortest_path(self, request):
+        name, source, target = request["graph"], request["source"], request["target"]
+        graph = self.graphs[name]
+        key = (name, source)
+        future = self._inflight.get(key)
+        if future is None:
+            self.searches += 1
+            file_key = _graph_file(graph)
+            if file_key is not None:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self._pool, _file_shortest_path_tree,
+                                              file_key, source)
+            else:
+                future = asyncio.ensure_future(asyncio.to_thread(_shortest_path_tree, graph,
+                                                                 source))
+            self._inflight[key] = future
+            future.add_done_callback(
+                lambda f: self._inflight.get(key) is f and self._inflight.pop(key))
+        else:
+            self.coalesced += 1
+        # shield: a client disconnecting must not cancel a search others wait on
+        tree = await asyncio.shield(future)
+        return _route(graph, tree, target)
+
+    async def _max_flow(self, request):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, _solve_max_flow, request["edges"],
+                                          request["source"], request["sink"])
+
+    async def _matching(self, request):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, _solve_matching, request["left"],
+                                          request["right"], request["edges"])
+
+    async def _list_graphs(self, request):
+        return {"graphs": sorted(self.graphs)}
+
+    async def _stats(self, request):
+        return {
+            "searches": self.searches,
+            "coalesced": self.coalesced,
+            "endpoints": {op: h.snapshot() for op, h in sorted(self.histograms.items())},
+        }
+
+
+class QueryClient:
+    """
+    Pipelining client: many calls may be in flight on one connection.
+    client = await QueryClient.connect(port); await client.call("graphs")
+    """
+
+    def __init__(self, reader, writer):
+        self._reader, self._writer = reader, writer
+        self._pending = {}
+        self._next_id = 0
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, port, host="127.0.0.1"):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def call(self, op, **params):
+        """Send one request and wait for its response dict."""
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "op": op, **params}).encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def _receive(self):
+        while line := await self._reader.readline():
+            response = json.loads(line)
+            future = self._pending.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self._pending.values():
+            future.set_exception(ConnectionError("server closed the connection"))
+        self._pending.clear()
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        await self._receiver
+
+
+# =========================
+# Localhost demo
+# =========================
+
+def _demo_graphs():
+    import os
+    import tempfile
+
+    from LargeGraphs import grid_graph, load_graph, save_graph
+
+    # The "city map" from DijkstraShortestPathsAlgorithm, undirected
+    city = {v: [] for v in "ABCDE"}
+    for u, v, w in [("A", "B", 3), ("A", "D", 4), ("A", "E", 7), ("B", "C", 10),
+                    ("B", "D", 4), ("D", "C", 8), ("D", "E", 8), ("E", "C", 2)]:
+        city[u].append((v, w))
+        city[v].append((u, w))
+    # The grid is saved and memory-mapped, so its searches run in the process pool
+    path = os.path.join(tempfile.gettempdir(), "query-server-grid.csr")
+    save_graph(path, grid_graph(300, 300))
+    return {"city": city, "grid": load_graph(path)}
+
+
+async def _demo():
+    import random
+
+    server = QueryServer(_demo_graphs(), processes=2)
+    port = await server.start()
+    print(f"listening on 127.0.0.1:{port}")
+    client = await QueryClient.connect(port)
+
+    print(await client.call("shortest_path", graph="city", source="A", target="C"))
+
+    # 200 concurrent grid queries from only 4 sources -> about 4 Dijkstra runs
+    rng = random.Random(0)
+    n = 300 * 300
+    sources = [0, n - 1, 150 * 300 + 150, 299]
+    start = time.perf_counter()
+    queries = asyncio.gather(*(
+        client.call("shortest_path", graph="grid", source=rng.choice(sources),
+                    target=rng.randrange(n))
+        for _ in range(200)))
+    # The event loop keeps answering other requests while the searches run
+    await asyncio.sleep(0.1)
+    ping = time.perf_counter()
+    await client.call("graphs")
+    ping = time.perf_counter() - ping
+    answers = await queries
+    print(f"200 grid queries in {time.perf_counter() - start:.2f} s, "
+          f"all ok: {all(a['ok'] for a in answers)}; "
+          f"a 'graphs' request during the searches took {ping * 1000:.1f} ms")
+
+    # CPU-heavy solves go to the process pool, concurrently with each other
+    left = [f"L{i}" for i in range(60)]
+    right = [f"R{i}" for i in range(60)]
+    jobs = [client.call("matching", left=left, right=right,
+                        edges=[[u, rng.choice(right)] for u in left for _ in range(3)])
+            for _ in range(8)]
+    jobs.append(client.call("max_flow", source="s", sink="t",
+                            edges=[["s", "a", 10], ["s", "b", 5], ["a", "b", 15],
+                                   ["a", "t", 10], ["b", "t", 10]]))
+    jobs.append(client.call("shortest_path", graph="nowhere", source=0, target=1))
+    results = await asyncio.gather(*jobs)
+    print("matching sizes:", [r["size"] for r in results[:8]])
+    print("max flow:", results[8]["max_flow"])
+    print("bad request:", results[9]["error"])
+
+    stats = (await client.call("stats"))
+    print(f"\nDijkstra runs: {stats['searches']}, coalesced requests: {stats['coalesced']}")
+    print(f"{'endpoint':<15} {'count':>6} {'mean ms':>9} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for op, h in stats["endpoints"].items():
+        print(f"{op:<15} {h['count']:>6} {h['mean_ms']:>9.2f} {h['p50_ms']:>8.2f} "
+              f"{h['p90_ms']:>8.2f} {h['p99_ms']:>8.2f} {h['max_ms']:>8.2f}")
+
+    await client.close()
+    await server.close()
+
+
+async def _serve(port):
+    server = QueryServer(_demo_graphs())
+    port = await server.start(port=port)
+    print(f"serving {sorted(server.graphs)} on 127.0.0.1:{port} (one JSON request per line)")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--serve", action="store_true", help="serve until interrupted")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.port) if args.serve else _demo())
+    except KeyboardInterrupt:
+        pass
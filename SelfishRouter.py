@@ -6,8 +6,13 @@ def total_cost(f1):
     f2 = 1 - f1
     return f1 * delay1(f1) + f2 * delay2(f2)
 
-f_values = np.linspace(0, 1, 21)
-costs = [total_cost(f) for f in f_values]
+def social_optimum(points=21):
+    # total_cost 对数组也成立，整条网格一次算完
+    f_values = np.linspace(0, 1, points)
+    costs = total_cost(f_values)
+    best = np.argmin(costs)
+    return f_values[best], costs[best]
 
-f1_opt = f_values[np.argmin(costs)]
-print("✅ 社会最优 f1 =", f1_opt, "f2 =", 1 - f1_opt, "最小总延迟 =", min(costs))
\ No newline at end of file
+if __name__ == "__main__":
+    f1_opt, min_cost = social_optimum()
+    print("✅ 社会最优 f1 =", f1_opt, "f2 =", 1 - f1_opt, "最小总延迟 =", min_cost)
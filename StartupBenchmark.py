@@ -0,0 +1,117 @@
+"""
+Import-time benchmark for the project modules, based on `python -X importtime`.
+
+Each module is imported in a fresh interpreter so caches from other modules
+don't hide its real cost. For every module we report:
+  - the cumulative import time (the module plus everything it pulls in)
+  - its heaviest dependency
+  - whether importing it printed anything (modules should be side-effect free:
+    demos belong under `if __name__ == "__main__":`)
+
+Run: python StartupBenchmark.py [module ...]
+"""
+
+import os
+import subprocess
+import sys
+
+# Every importable module in the project ("Network Flow.py" has a space in its
+# name, so it can only be run as a script; FindBestMatchingWithMaxFLow has the same code).
+MODULES = [
+    "BinarySearch",
+    "DijkstraShortestPathsAlgorithm",
+    "LargeGraphs",
+    "DynamicProgramming",
+    "DPToolkit",
+    "MatricxChain",
+    "Alignment",
+    "FindBestMatchingWithMaxFLow",
+    "SortComparison",
+    "MathForML",
+    "Notation",
+    "GameTheory",
+    "NashSolver",
+    "SelfishRouter",
+    "TrafficAssignment",
+    "inequality",
+    "TailBoundSimulation",
+    "Pandas",
+    "QueryServer",
+]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output into a list of (name, self_us, cumulative_us, depth).
+    Lines look like: "import time:       812 |       1204 |   numpy.core"
+    where the indentation of the name shows nesting depth.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        name = name[1:]  # drop the single space after the separator
+        indent = len(name) - len(name.lstrip())
+        rows.append((name.strip(), int(self_us), int(cum_us), indent // 2))
+    return rows
+
+
+def _children(rows, index):
+    """
+    Direct imports of rows[index]. -X importtime prints a module after everything
+    it imports, so its subtree is the contiguous block of deeper rows just before it.
+    """
+    depth = rows[index][3]
+    children = []
+    for row in reversed(rows[:index]):
+        if row[3] <= depth:
+            break
+        if row[3] == depth + 1:
+            children.append(row)
+    return children
+
+
+def measure_import(module, repeat=3):
+    """
+    Import `module` in `repeat` fresh interpreters and keep the fastest run.
+    Returns dict(module, cumulative_ms, heaviest, heaviest_ms, printed).
+    """
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=HERE, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"importing {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+        rows = parse_importtime(proc.stderr)
+        own = [i for i, r in enumerate(rows) if r[0] == module]
+        cumulative = rows[own[-1]][2] if own else 0
+        deps = _children(rows, own[-1]) if own else []
+        heaviest = max(deps, key=lambda r: r[2]) if deps else ("-", 0, 0, 0)
+        result = {
+            "module": module,
+            "cumulative_ms": cumulative / 1000,
+            "heaviest": heaviest[0],
+            "heaviest_ms": heaviest[2] / 1000,
+            "printed": bool(proc.stdout.strip()),
+        }
+        if best is None or result["cumulative_ms"] < best["cumulative_ms"]:
+            best = result
+    return best
+
+
+def run(modules=MODULES, repeat=3):
+    results = [measure_import(m, repeat) for m in modules]
+    print(f"{'module':<32} {'import (ms)':>12}   {'heaviest dependency':<28} {'(ms)':>8}  side effects")
+    for r in sorted(results, key=lambda r: r["cumulative_ms"]):
+        flag = "PRINTS ON IMPORT" if r["printed"] else ""
+        print(f"{r['module']:<32} {r['cumulative_ms']:>12.1f}   {r['heaviest']:<28} {r['heaviest_ms']:>8.1f}  {flag}")
+    return results
+
+
+if __name__ == "__main__":
+    run(sys.argv[1:] or MODULES)
@@ -0,0 +1,122 @@
+"""
+用蒙特卡洛模拟检验 inequality.py 里的概率上界有多紧
+
+inequality.py 只算出 Markov / Chebyshev / Chernoff / Union Bound 的理论上界，
+但我们拿它们来估算服务器数量，需要知道真实的超载概率到底差多少。这里：
+  - 每次试验给 n 台服务器各生成一个负载 X（Poisson(mu) 或 Binomial(tasks, mu/tasks)）
+  - 统计单台服务器超载的频率 P(X≥a)，以及“任一服务器超载”的频率 P(max X≥a)
+  - 按块（chunk）向量化生成，内存只和块大小有关，与总试验次数无关；
+    试验次数多时可以开多进程，每块用独立的随机种子，结果可复现
+  - 在参数网格上与各个上界对比，结果写成一张紧凑的 CSV 表
+注意：inequality.py 用的 Chernoff 形式 exp(-δ²μ/3) 只在 0 < δ ≤ 1 时成立，
+δ 更大时（例如 mu=1, a=10）模拟出的真实概率会高于这个“上界”。
+"""
+
+import csv
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from inequality import tail_bounds
+
+# 每块最多生成多少个负载样本（int64 下约 64MB）
+CHUNK_ELEMENTS = 8_000_000
+
+
+def _simulate_chunk(args):
+    """模拟一块试验，返回 (超载的服务器-试验数, 有服务器超载的试验数)。"""
+    seed, trials, n, mu, a, dist, tasks = args
+    rng = np.random.default_rng(seed)
+    if dist == "poisson":
+        loads = rng.poisson(mu, size=(trials, n))
+    elif dist == "binomial":
+        loads = rng.binomial(tasks, mu / tasks, size=(trials, n))
+    else:
+        raise ValueError(f"未知分布 {dist!r}")
+    over = loads >= a
+    return int(over.sum()), int(over.any(axis=1).sum())
+
+
+def simulate_overload(mu, a, n, trials, dist="poisson", tasks=1000, seed=0,
+                      processes=1, chunk_elements=CHUNK_ELEMENTS):
+    """
+    模拟 trials 次“n 台服务器同时运行”，返回经验概率：
+      - server: 单台服务器 P(X≥a)（对所有服务器、所有试验取平均）
+      - system: 任一服务器超载的概率 P(max X≥a)
+    processes > 1 时按块分给多个进程并行。
+    """
+    if trials <= 0 or n <= 0:
+        raise ValueError("trials 和 n 都必须是正整数")
+    per_chunk = max(1, chunk_elements // n)
+    sizes = [per_chunk] * (trials // per_chunk)
+    if trials % per_chunk:
+        sizes.append(trials % per_chunk)
+    # 每块一个独立的子种子：无论几个进程，结果都一样
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(s, size, n, mu, a, dist, tasks) for s, size in zip(seeds, sizes)]
+
+    if processes == 1:
+        parts = map(_simulate_chunk, jobs)
+        server_hits, system_hits = _sum_parts(parts)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            server_hits, system_hits = _sum_parts(pool.map(_simulate_chunk, jobs))
+
+    return {"server": server_hits / (trials * n), "system": system_hits / trials}
+
+
+def _sum_parts(parts):
+    server_hits = system_hits = 0
+    for s, y in parts:
+        server_hits += s
+        system_hits += y
+    return server_hits, system_hits
+
+
+def validate_grid(mus, thresholds, n, trials, sigma=None, dist="poisson", tasks=1000,
+                  seed=0, processes=1, out_path=None):
+    """
+    在 (mu, a) 参数网格上对比经验概率与各个上界。
+    sigma 省略时取所选分布的真实标准差：Poisson 为 sqrt(mu)，
+    Binomial(tasks, mu/tasks) 为 sqrt(mu * (1 - mu/tasks))。
+    返回结果行列表；给出 out_path 时同时写成 CSV。
+    """
+    rows = []
+    for mu in mus:
+        for a in thresholds:
+            if a <= mu:
+                continue  # 上界只对 a > mu 有意义
+            if sigma is not None:
+                s = sigma
+            elif dist == "binomial":
+                s = math.sqrt(mu * (1 - mu / tasks))
+            else:
+                s = math.sqrt(mu)
+            emp = simulate_overload(mu, a, n, trials, dist=dist, tasks=tasks, seed=seed,
+                                    processes=processes)
+            bounds = tail_bounds(mu, a, s, n)
+            rows.append({
+                "mu": mu, "a": a, "sigma": s, "n": n, "trials": trials,
+                "empirical_server": emp["server"], "empirical_system": emp["system"],
+                **bounds,
+            })
+    if out_path is not None:
+        with open(out_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else [])
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({k: (f"{v:.4g}" if isinstance(v, float) else v) for k, v in row.items()})
+    return rows
+
+
+if __name__ == "__main__":
+    rows = validate_grid(mus=[1, 2, 4], thresholds=[3, 5, 8, 10], n=1000, trials=20000,
+                         processes=2, out_path="tail_bounds.csv")
+    print(f"{'mu':>3} {'a':>3} {'经验(单台)':>11} {'Markov':>9} {'Chebyshev':>10} {'Chernoff':>10}"
+          f" {'经验(系统)':>11} {'Union':>10}")
+    for r in rows:
+        print(f"{r['mu']:>3} {r['a']:>3} {r['empirical_server']:>11.3e} {r['markov']:>9.3f}"
+              f" {r['chebyshev']:>10.3f} {r['chernoff']:>10.3e} {r['empirical_system']:>11.3e}"
+              f" {r['union']:>10.3e}")
+    print("\n结果已写入 tail_bounds.csv")
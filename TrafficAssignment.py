@@ -0,0 +1,167 @@
+"""
+交通分配：Wardrop 用户均衡（自私路由）与系统最优（SelfishRouter.py 的通用版本）
+
+SelfishRouter.py 只比较两条平行路，用 21 个网格点暴力找社会最优。
+这里用 Frank–Wolfe 算法在任意有向网络上求解：
+  - 用户均衡（UE）：每个人都走自己最快的路，所有被使用的路径耗时相等
+  - 系统最优（SO）：总耗时最小；等价于把每条路的耗时换成“边际成本” t(x) + x t'(x) 再求 UE
+  - 两者总耗时之比就是无政府代价（price of anarchy）
+
+每条路的耗时函数统一写成  t(x) = free + coef * x^power：
+  - BPR 函数 t0 * (1 + alpha * (x / cap)^beta) → free=t0, coef=t0*alpha/cap^beta, power=beta
+  - 线性函数 a*x + b → free=b, coef=a, power=1
+这样所有路的耗时可以用 NumPy 一次性向量化更新；
+每轮的“全有全无”分配（all-or-nothing）调用本项目的 dijkstra 求最短路。
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from DijkstraShortestPathsAlgorithm import dijkstra
+
+# 求解结果：每条路的流量、耗时、系统总耗时、相对间隙（收敛程度）、迭代次数
+Assignment = namedtuple("Assignment", ["flows", "times", "total_cost", "gap", "iterations"])
+
+
+def bpr_link(u, v, free_flow_time, capacity, alpha=0.15, beta=4):
+    """BPR 耗时函数的一条路：t0 * (1 + alpha * (x / capacity)^beta)。"""
+    return (u, v, free_flow_time, free_flow_time * alpha / capacity ** beta, beta)
+
+
+def linear_link(u, v, a, b):
+    """线性耗时函数的一条路：a * x + b。"""
+    return (u, v, b, a, 1)
+
+
+def _link_arrays(links):
+    free = np.array([l[2] for l in links], dtype=float)
+    coef = np.array([l[3] for l in links], dtype=float)
+    power = np.array([l[4] for l in links], dtype=float)
+    return free, coef, power
+
+
+def link_times(x, free, coef, power):
+    """所有路的耗时，向量化计算。"""
+    return free + coef * x ** power
+
+
+def _all_or_nothing(links, nodes, times, demand_by_origin):
+    """
+    全有全无分配：按当前耗时，把每个 OD 对的需求全部放到最短路上。
+    平行路（同一对 u, v 之间多条路）只保留当前最快的一条参与最短路计算。
+    """
+    best = {}
+    for idx, (u, v) in enumerate((l[0], l[1]) for l in links):
+        if (u, v) not in best or times[idx] < times[best[(u, v)]]:
+            best[(u, v)] = idx
+
+    graph = {node: [] for node in nodes}
+    for (u, v), idx in best.items():
+        graph[u].append((v, times[idx]))
+
+    y = np.zeros(len(links))
+    for origin, dests in demand_by_origin.items():
+        dist, prev = dijkstra(graph, origin)
+        for dest, volume in dests.items():
+            if dist[dest] == float('inf'):
+                raise ValueError(f"{origin} 无法到达 {dest}")
+            node = dest
+            while node != origin:
+                p = prev[node]
+                y[best[(p, node)]] += volume
+                node = p
+    return y
+
+
+def _line_search(x, d, free, coef, power, iters=40):
+    """
+    沿方向 d 找步长 a ∈ [0, 1]，使 Beckmann 目标函数最小。
+    目标函数的导数是 sum(d * t(x + a d))，随 a 单调递增，用二分找零点。
+    """
+    if np.dot(d, link_times(x + d, free, coef, power)) <= 0:
+        return 1.0
+    lo, hi = 0.0, 1.0
+    for _ in range(iters):
+        mid = (lo + hi) / 2
+        if np.dot(d, link_times(x + mid * d, free, coef, power)) > 0:
+            hi = mid
+        else:
+            lo = mid
+    return (lo + hi) / 2
+
+
+def frank_wolfe(links, demand, system_optimum=False, max_iter=500, tol=1e-6):
+    """
+    Frank–Wolfe 交通分配。
+    参数：
+      - links: [(u, v, free, coef, power), ...]，可以用 bpr_link / linear_link 生成
+      - demand: {(起点, 终点): 需求量}
+      - system_optimum: False 求用户均衡，True 求系统最优
+      - tol: 相对间隙 (t·x - t·y) / t·x 小于它就停止
+    返回 Assignment；times 与 total_cost 总是按真实耗时 t(x) 计算。
+    """
+    free, coef, power = _link_arrays(links)
+    # 系统最优 = 用边际成本 free + coef*(power+1)*x^power 做用户均衡
+    cost_coef = coef * (power + 1) if system_optimum else coef
+
+    nodes = set()
+    for l in links:
+        nodes.add(l[0])
+        nodes.add(l[1])
+    demand_by_origin = {}
+    for (o, d), volume in demand.items():
+        nodes.add(o)
+        nodes.add(d)
+        demand_by_origin.setdefault(o, {})[d] = volume
+
+    x = _all_or_nothing(links, nodes, link_times(np.zeros(len(links)), free, cost_coef, power),
+                        demand_by_origin)
+    gap = float('inf')
+    it = 0
+    for it in range(1, max_iter + 1):
+        t = link_times(x, free, cost_coef, power)
+        y = _all_or_nothing(links, nodes, t, demand_by_origin)
+        tx = np.dot(t, x)
+        gap = (tx - np.dot(t, y)) / tx if tx > 0 else 0.0
+        if gap < tol:
+            break
+        d = y - x
+        x = x + _line_search(x, d, free, cost_coef, power) * d
+
+    times = link_times(x, free, coef, power)
+    return Assignment(x, times, float(np.dot(x, times)), gap, it)
+
+
+def price_of_anarchy(links, demand, **kwargs):
+    """
+    分别求用户均衡和系统最优，返回 (PoA, 用户均衡结果, 系统最优结果)。
+    PoA = 用户均衡总耗时 / 系统最优总耗时 >= 1。
+    """
+    ue = frank_wolfe(links, demand, system_optimum=False, **kwargs)
+    so = frank_wolfe(links, demand, system_optimum=True, **kwargs)
+    return ue.total_cost / so.total_cost, ue, so
+
+
+if __name__ == "__main__":
+    # SelfishRouter.py 的两条平行路：delay1 = 3f，delay2 = 5，总需求 1
+    links = [linear_link("s", "t", 3, 0), linear_link("s", "t", 0, 5)]
+    poa, ue, so = price_of_anarchy(links, {("s", "t"): 1})
+    print(f"✅ 用户均衡 f1 = {ue.flows[0]:.4f}，总延迟 = {ue.total_cost:.4f}")
+    print(f"✅ 社会最优 f1 = {so.flows[0]:.4f}，总延迟 = {so.total_cost:.4f}")
+    print(f"无政府代价 PoA = {poa:.4f}")
+
+    # 10x10 的网格城市（双向路，BPR 耗时），四个角之间互相出行
+    size = 10
+    grid = []
+    for i in range(size):
+        for j in range(size):
+            for di, dj in ((0, 1), (1, 0)):
+                if i + di < size and j + dj < size:
+                    a, b = (i, j), (i + di, j + dj)
+                    grid.append(bpr_link(a, b, 1.0, 50))
+                    grid.append(bpr_link(b, a, 1.0, 50))
+    corners = [(0, 0), (0, size - 1), (size - 1, 0), (size - 1, size - 1)]
+    demand = {(o, d): 100 for o in corners for d in corners if o != d}
+    poa, ue, so = price_of_anarchy(grid, demand, max_iter=2000, tol=1e-5)
+    print(f"网格城市：UE 总耗时 {ue.total_cost:,.0f}，SO 总耗时 {so.total_cost:,.0f}，PoA = {poa:.4f}")
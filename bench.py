@@ -0,0 +1,339 @@
+"""
+Unified benchmark / profiling entry point for every algorithm in the project.
+
+Each scenario is registered with @scenario and knows how to build a synthetic
+input for a given size ("small", "medium", "large", or an explicit number).
+For every scenario the tool collects:
+  - wall time: best of --repeat runs (time.perf_counter), input building excluded;
+    very fast scenarios are looped inside each run and reported per call
+  - peak memory: one extra run under tracemalloc
+  - optional cProfile hot spots (--profile)
+Results can be saved as a baseline JSON and later runs compared against it.
+
+Examples:
+  python bench.py --list
+  python bench.py dijkstra sort.* --size medium
+  python bench.py --save baseline.json
+  python bench.py --compare baseline.json --threshold 1.2
+  python bench.py chain.dp --profile --top 10
+"""
+
+import argparse
+import cProfile
+import fnmatch
+import io
+import json
+import pstats
+import random
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+Scenario = namedtuple("Scenario", ["name", "build", "sizes", "description"])
+
+SCENARIOS = {}
+SIZES = ("small", "medium", "large")
+MIN_BATCH_S = 0.05
+
+
+def scenario(name, sizes, description=""):
+    """
+    Register a scenario. `sizes` maps small/medium/large to the scale n passed
+    to the builder. The builder gets (n, rng) and returns a zero-argument
+    callable that runs the algorithm once on a prepared input.
+    """
+    def decorator(build):
+        SCENARIOS[name] = Scenario(name, build, dict(zip(SIZES, sizes)), description)
+        return build
+    return decorator
+
+
+# =========================
+# Synthetic input generators
+# =========================
+
+def random_graph(n, rng, degree=4, max_weight=100):
+    """Directed graph in Dijkstra's format: dict[node] -> list[(neighbor, weight)]."""
+    graph = {u: [] for u in range(n)}
+    for u in range(n):
+        # A ring edge keeps everything reachable from node 0
+        graph[u].append(((u + 1) % n, rng.randint(1, max_weight)))
+        for _ in range(degree - 1):
+            graph[u].append((rng.randrange(n), rng.randint(1, max_weight)))
+    return graph
+
+
+def random_flow_network(n, rng, degree=3, max_capacity=20):
+    """Layered dict-of-dict capacity graph from 's' to 't' with n inner nodes."""
+    layers = max(2, int(n ** 0.5))
+    inner = [f"v{i}" for i in range(n)]
+    layer_of = {v: i * layers // n for i, v in enumerate(inner)}
+    by_layer = [[v for v in inner if layer_of[v] == k] for k in range(layers)]
+    graph = {"s": {}, "t": {}}
+    for v in inner:
+        graph[v] = {}
+    for v in by_layer[0]:
+        graph["s"][v] = rng.randint(1, max_capacity)
+    for v in by_layer[-1]:
+        graph[v]["t"] = rng.randint(1, max_capacity)
+    for k in range(layers - 1):
+        for u in by_layer[k]:
+            for _ in range(degree):
+                graph[u][rng.choice(by_layer[k + 1])] = rng.randint(1, max_capacity)
+    return graph
+
+
+def random_bipartite(n, rng, degree=3):
+    """n left nodes, n right nodes, `degree` random allowed pairs per left node."""
+    left = [f"L{i}" for i in range(n)]
+    right = [f"R{i}" for i in range(n)]
+    edges = sorted({(u, rng.choice(right)) for u in left for _ in range(degree)})
+    return left, right, edges
+
+
+def random_sentence(n, rng, vocabulary=50):
+    return " ".join(f"w{rng.randrange(vocabulary)}" for _ in range(n))
+
+
+# =========================
+# Scenarios
+# =========================
+
+@scenario("dijkstra", (1_000, 20_000, 200_000), "Dijkstra on a random sparse graph")
+def _dijkstra(n, rng):
+    from DijkstraShortestPathsAlgorithm import dijkstra
+    graph = random_graph(n, rng)
+    return lambda: dijkstra(graph, 0)
+
+
+@scenario("maxflow", (100, 1_000, 5_000), "Edmonds-Karp on a layered network")
+def _maxflow(n, rng):
+    from FindBestMatchingWithMaxFLow import edmonds_karp_max_flow
+    graph = random_flow_network(n, rng)
+    return lambda: edmonds_karp_max_flow(graph, "s", "t")
+
+
+@scenario("matching", (100, 500, 2_000), "Bipartite matching via max flow")
+def _matching(n, rng):
+    from FindBestMatchingWithMaxFLow import max_bipartite_matching_via_flow
+    left, right, edges = random_bipartite(n, rng)
+    return lambda: max_bipartite_matching_via_flow(left, right, edges, show_steps=False)
+
+
+@scenario("alignment", (50, 300, 1_000), "Word alignment score (rolling DP rows)")
+def _alignment(n, rng):
+    from Alignment import alignment_score
+    s1, s2 = random_sentence(n, rng), random_sentence(n, rng)
+    # Skip the memo cache so every run does the real work
+    return lambda: alignment_score.__wrapped__(s1, s2)
+
+
+def _sort_scenario(name, func_name, sizes, inplace_range=False):
+    @scenario(f"sort.{name}", sizes, f"{func_name} on random integers")
+    def build(n, rng):
+        import SortComparison
+        fn = getattr(SortComparison, func_name)
+        data = [rng.randint(0, 1_000_000) for _ in range(n)]
+        if inplace_range:
+            return lambda: fn(data[:], 0, n - 1)
+        return lambda: fn(data[:])
+    return build
+
+
+_sort_scenario("bubble", "bubble_sort", (500, 2_000, 5_000))
+_sort_scenario("insertion", "insertion_sort", (500, 2_000, 5_000))
+_sort_scenario("merge", "merge_sort", (10_000, 100_000, 1_000_000))
+_sort_scenario("quick", "quick_sort_inplace", (10_000, 100_000, 1_000_000), inplace_range=True)
+_sort_scenario("heap", "heap_sort", (10_000, 100_000, 1_000_000))
+
+
+@scenario("sort.builtin", (10_000, 100_000, 1_000_000), "Python's sorted() as a reference")
+def _sort_builtin(n, rng):
+    data = [rng.randint(0, 1_000_000) for _ in range(n)]
+    return lambda: sorted(data)
+
+
+def _search_setup(n, rng, queries=10_000):
+    arr = list(range(0, 2 * n, 2))
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+    return arr, targets
+
+
+@scenario("search.binary", (10_000, 1_000_000, 10_000_000), "10k binary_search lookups")
+def _search_binary(n, rng):
+    from BinarySearch import binary_search
+    arr, targets = _search_setup(n, rng)
+    return lambda: [binary_search(arr, t) for t in targets]
+
+
+@scenario("search.eytzinger", (10_000, 1_000_000, 10_000_000), "10k eytzinger_search lookups")
+def _search_eytzinger(n, rng):
+    from BinarySearch import build_eytzinger, eytzinger_search
+    arr, targets = _search_setup(n, rng)
+    layout = build_eytzinger(arr)
+    return lambda: [eytzinger_search(layout, t) for t in targets]
+
+
+@scenario("search.eytzinger_many", (10_000, 1_000_000, 10_000_000), "10k lookups as one NumPy batch")
+def _search_batch(n, rng):
+    from BinarySearch import build_eytzinger_array, eytzinger_search_many
+    arr, targets = _search_setup(n, rng)
+    layout = build_eytzinger_array(arr)
+    return lambda: eytzinger_search_many(layout, targets)
+
+
+@scenario("fib.table", (1_000, 20_000, 200_000), "Table/rolling Fibonacci (cache bypassed)")
+def _fib_table(n, rng):
+    from DynamicProgramming import fibonacci
+    return lambda: fibonacci.__wrapped__(n)
+
+
+@scenario("fib.fast", (1_000, 20_000, 200_000), "Fast-doubling Fibonacci")
+def _fib_fast(n, rng):
+    from DynamicProgramming import fibonacci_fast
+    return lambda: fibonacci_fast(n)
+
+
+def _chain_dims(n, rng):
+    return [rng.randint(1, 512) for _ in range(n + 1)]
+
+
+@scenario("chain.dp", (20, 100, 250), "Matrix-chain DP, pure Python (cache bypassed)")
+def _chain_dp(n, rng):
+    from MatricxChain import matrix_chain_plan
+    p = _chain_dims(n, rng)
+    return lambda: matrix_chain_plan.__wrapped__(p)
+
+
+@scenario("chain.vectorized", (20, 300, 1_000), "Matrix-chain DP, NumPy diagonals")
+def _chain_vectorized(n, rng):
+    from MatricxChain import matrix_chain_plan_vectorized
+    p = _chain_dims(n, rng)
+    return lambda: matrix_chain_plan_vectorized(p)
+
+
+@scenario("chain.greedy", (1_000, 100_000, 1_000_000), "Matrix-chain O(n) heuristic")
+def _chain_greedy(n, rng):
+    from MatricxChain import matrix_chain_greedy
+    p = _chain_dims(n, rng)
+    return lambda: matrix_chain_greedy(p)
+
+
+# =========================
+# Measurement
+# =========================
+
+def measure(sc, n, repeat=3, seed=0, profile=False, top=15):
+    """Run one scenario at scale n; returns a result dict (plus profile text if asked)."""
+    run = sc.build(n, random.Random(seed))
+
+    # Fast scenarios are looped so each timed batch lasts at least MIN_BATCH_S,
+    # otherwise timer noise dominates microsecond-scale runs
+    start = time.perf_counter()
+    run()
+    once = time.perf_counter() - start
+    number = max(1, min(10_000, int(MIN_BATCH_S / once) if once > 0 else 10_000))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {"scenario": sc.name, "n": n, "wall_s": best, "peak_bytes": peak}
+    if profile:
+        prof = cProfile.Profile()
+        prof.runcall(run)
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(top)
+        result["profile"] = out.getvalue()
+    return result
+
+
+def select(patterns):
+    """Scenario names matching any of the glob patterns (all if none given)."""
+    if not patterns:
+        return list(SCENARIOS)
+    names = [name for name in SCENARIOS if any(fnmatch.fnmatch(name, p) for p in patterns)]
+    unknown = [p for p in patterns if not any(fnmatch.fnmatch(n, p) for n in SCENARIOS)]
+    if unknown:
+        raise SystemExit(f"unknown scenario(s): {', '.join(unknown)} (see --list)")
+    return names
+
+
+def compare(results, baseline, threshold):
+    """Print ratios against a baseline; returns the names that got slower than threshold."""
+    regressions = []
+    print(f"\n{'scenario':<24} {'time ratio':>11} {'memory ratio':>13}")
+    for r in results:
+        base = baseline.get(r["scenario"])
+        if base is None or base["n"] != r["n"]:
+            print(f"{r['scenario']:<24} {'(no matching baseline)':>25}")
+            continue
+        t_ratio = r["wall_s"] / base["wall_s"] if base["wall_s"] else float("inf")
+        m_ratio = r["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else 1.0
+        flag = "  REGRESSION" if t_ratio > threshold else ""
+        print(f"{r['scenario']:<24} {t_ratio:>10.2f}x {m_ratio:>12.2f}x{flag}")
+        if flag:
+            regressions.append(r["scenario"])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", help="scenario names or globs (default: all)")
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    parser.add_argument("--size", default="small",
+                        help="small / medium / large, or an explicit scale n")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per scenario (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", action="store_true", help="print cProfile hot spots")
+    parser.add_argument("--top", type=int, default=15, help="rows of profile output")
+    parser.add_argument("--save", metavar="JSON", help="write results as a baseline file")
+    parser.add_argument("--compare", metavar="JSON", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="time ratio above which --compare reports a regression")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for sc in SCENARIOS.values():
+            sizes = "/".join(f"{v:,}" for v in sc.sizes.values())
+            print(f"{sc.name:<24} {sizes:<28} {sc.description}")
+        return 0
+
+    results = []
+    print(f"{'scenario':<24} {'n':>12} {'time (ms)':>12} {'peak mem (KiB)':>15}")
+    for name in select(args.scenarios):
+        sc = SCENARIOS[name]
+        n = sc.sizes[args.size] if args.size in sc.sizes else int(args.size)
+        r = measure(sc, n, args.repeat, args.seed, args.profile, args.top)
+        results.append(r)
+        print(f"{name:<24} {n:>12,} {r['wall_s'] * 1000:>12.2f} {r['peak_bytes'] / 1024:>15,.1f}")
+        if args.profile:
+            print(r["profile"])
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({r["scenario"]: {k: r[k] for k in ("n", "wall_s", "peak_bytes")} for r in results},
+                      f, indent=2)
+        print(f"\nbaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
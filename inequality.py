@@ -5,25 +5,38 @@ mu = 1        # 期望值 E[X]
 a = 10        # 超过 10 个任务
 sigma = 3     # 假设方差约为 3（举例用）
 n = 1000      # 服务器总数
-delta = (a - mu) / mu  # Chernoff 偏差比例
+
 
 # ========== 各种不等式 ==========
-# 1️⃣ Markov 不等式
-markov = mu / a
+def tail_bounds(mu, a, sigma, n):
+    """
+    计算 P(X≥a) 的几种上界，返回 dict。
+    TailBoundSimulation.py 会用蒙特卡洛模拟检验这些上界有多紧。
+    """
+    delta = (a - mu) / mu  # Chernoff 偏差比例
+
+    # 1️⃣ Markov 不等式
+    markov = mu / a
+
+    # 2️⃣ Chebyshev 不等式
+    k = (a - mu) / sigma
+    chebyshev = 1 / (k ** 2)
+
+    # 3️⃣ Chernoff 上界（假设 X ~ Poisson 或二项分布）
+    chernoff = math.exp(-delta**2 * mu / 3)
+
+    # 4️⃣ Union Bound （系统中任一服务器超载）
+    union_bound = n * chernoff
 
-# 2️⃣ Chebyshev 不等式
-k = (a - mu) / sigma
-chebyshev = 1 / (k ** 2)
+    return {"markov": markov, "chebyshev": chebyshev, "chernoff": chernoff, "union": union_bound}
 
-# 3️⃣ Chernoff 上界（假设 X ~ Poisson 或二项分布）
-chernoff = math.exp(-delta**2 * mu / 3)
 
-# 4️⃣ Union Bound （系统中任一服务器超载）
-union_bound = n * chernoff
+if __name__ == "__main__":
+    bounds = tail_bounds(mu, a, sigma, n)
 
-# ========== 输出比较 ==========
-print("📊 各不等式概率上界比较：\n")
-print(f"Markov 上界:      P(X≥{a}) ≤ {markov:.4f}")
-print(f"Chebyshev 上界:   P(X≥{a}) ≤ {chebyshev:.4f}")
-print(f"Chernoff 上界:    P(X≥{a}) ≤ {chernoff:.3e}")
-print(f"Union Bound 系统: P(any server overload) ≤ {union_bound:.3e}")
\ No newline at end of file
+    # ========== 输出比较 ==========
+    print("📊 各不等式概率上界比较：\n")
+    print(f"Markov 上界:      P(X≥{a}) ≤ {bounds['markov']:.4f}")
+    print(f"Chebyshev 上界:   P(X≥{a}) ≤ {bounds['chebyshev']:.4f}")
+    print(f"Chernoff 上界:    P(X≥{a}) ≤ {bounds['chernoff']:.3e}")
+    print(f"Union Bound 系统: P(any server overload) ≤ {bounds['union']:.3e}")